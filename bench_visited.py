@@ -0,0 +1,77 @@
+"""
+Memory and speed of the visited-URL stores in engine.py.
+
+    python bench_visited.py            # 1,000,000 URLs
+    python bench_visited.py 200000     # smaller run
+
+For each store it reports the memory held per URL (measured with tracemalloc,
+including the URL strings a plain set keeps alive), that scaled to 1M URLs,
+the time per check-and-add and per lookup of an absent URL, and the
+false-positive rate seen on 100,000 URLs that were never added.
+"""
+
+import sys
+import time
+import random
+import tracemalloc
+
+from engine import URLHashSet, ScalableBloomFilter
+
+
+def make_urls(n: int, seed: int) -> list:
+    rng = random.Random(seed)
+    depts = ["cse", "ee", "me", "ce", "chem", "phy", "math", "hss", "bio", "aero"]
+    return [
+        f"https://www.iit{rng.randint(1, 23)}.ac.in/{rng.choice(depts)}/people/faculty/"
+        f"{rng.randrange(10**6):06d}?tab={rng.choice(('profile', 'publications', 'teaching'))}&p={i}"
+        for i in range(n)
+    ]
+
+
+def build(factory, urls: list):
+    store = factory()
+    for url in urls:
+        if url not in store:        # the crawler's check-then-add pattern
+            store.add(url)
+    return store
+
+
+def measure(name: str, factory, urls: list, probes: list):
+    start = time.perf_counter()
+    store = build(factory, urls)
+    add_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    false_hits = sum(1 for url in probes if url in store)
+    look_s = time.perf_counter() - start
+    del store
+
+    # Memory in a second, traced pass (tracemalloc slows allocation down). The
+    # URL strings were built outside the trace; a plain set keeps them alive and
+    # the compact stores don't, so the set is charged for them.
+    tracemalloc.start()
+    store = build(factory, urls)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if isinstance(store, set):
+        held += sum(sys.getsizeof(u) for u in urls)
+
+    n = len(urls)
+    print(f"{name:<16} {held / n:>7.1f} B/URL {held / n * 1e6 / 2**20:>7.1f} MiB/1M URLs "
+          f"{add_s / n * 1e6:>6.2f} µs/add {look_s / len(probes) * 1e6:>6.2f} µs/miss "
+          f"{false_hits / len(probes):>8.5f} FP rate")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    urls   = make_urls(n, seed=1)
+    probes = make_urls(100_000, seed=2)
+    print(f"{n:,} URLs, mean length {sum(map(len, urls)) / n:.0f} chars\n")
+    measure("set of str", set, urls, probes)
+    measure("URLHashSet", URLHashSet, urls, probes)
+    measure("Bloom fp=0.01", lambda: ScalableBloomFilter(0.01), urls, probes)
+    measure("Bloom fp=0.001", lambda: ScalableBloomFilter(0.001), urls, probes)
+
+
+if __name__ == "__main__":
+    main()
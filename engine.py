@@ -0,0 +1,2757 @@
+"""
+Crawl engine behind every SmartExtract front-end: the CLI (scraper.py), the
+interactive prompt (dyamic.py) and the GUI (gui.py).
+
+    sink = make_sink("out.jsonl")
+    engine = CrawlEngine("https://cs.example.edu", "machine learning",
+                         on_result=print, sinks=[sink])
+    engine.run()
+    sink.close()
+
+CrawlEngine reports through optional hooks — on_result(PageResult),
+on_log(message, kind) and on_progress(crawled, matched, page_budget) — streams
+matches to ResultSinks, and stops early when its CancelToken is cancelled.
+"""
+
+import requests
+from bs4 import BeautifulSoup
+from lxml import etree
+from urllib.parse import urlsplit, urlunsplit, SplitResult
+import urllib3
+import csv
+import time
+import re
+import json
+import logging
+import asyncio
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import types
+import sqlite3
+import tempfile
+import gzip
+import hashlib
+import heapq
+import itertools
+import math
+import base64
+from array import array
+from datetime import datetime
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from threading import Lock, Event
+from dataclasses import dataclass, field, asdict
+from typing import Iterable, Optional
+
+try:
+    import aiohttp          # optional: only needed for --engine async
+except ImportError:
+    aiohttp = None
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# ─── ANSI Colors ────────────────────────────────────────────────────────────────
+class C:
+    RESET   = "\033[0m"
+    BOLD    = "\033[1m"
+    RED     = "\033[91m"
+    GREEN   = "\033[92m"
+    YELLOW  = "\033[93m"
+    BLUE    = "\033[94m"
+    MAGENTA = "\033[95m"
+    CYAN    = "\033[96m"
+    WHITE   = "\033[97m"
+    GREY    = "\033[90m"
+
+# ─── Logging ─────────────────────────────────────────────────────────────────
+def setup_logger(verbose: bool) -> logging.Logger:
+    logger = logging.getLogger("extractor")
+    logger.setLevel(logging.DEBUG if verbose else logging.WARNING)
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(f"{C.GREY}[%(levelname)s] %(message)s{C.RESET}"))
+    logger.addHandler(handler)
+    file_handler = logging.FileHandler("extractor.log", encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    logger.addHandler(file_handler)
+    return logger
+
+# ─── Data Model ──────────────────────────────────────────────────────────────
+@dataclass
+class PageResult:
+    url: str
+    names: list = field(default_factory=list)
+    emails: list = field(default_factory=list)
+    phones: list = field(default_factory=list)
+    departments: list = field(default_factory=list)
+    matched_snippets: list = field(default_factory=list)
+    keyword_count: int = 0
+    page_title: str = ""
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    depth: int = 0
+    seed: str = ""
+
+@dataclass
+class Seed:
+    """One site of a crawl job: where to start, how deep to go and its page budget."""
+    url: str
+    max_depth: int = 2
+    max_pages: int = 200
+    allow_subdomains: bool = False
+    pages_crawled: int = 0
+    matched: int = 0
+    base_domain: str = field(init=False, default="")
+
+    def __post_init__(self):
+        self.base_domain = urlsplit(normalize_url(self.url)).netloc
+
+def result_to_dict(r: PageResult) -> dict:
+    return dict(asdict(r), matched_keywords=getattr(r, "matched_keywords", []))
+
+def result_from_dict(data: dict) -> PageResult:
+    data = dict(data)
+    matched_keywords = data.pop("matched_keywords", [])
+    r = PageResult(**data)
+    r.matched_keywords = matched_keywords
+    return r
+
+# ─── Extraction Patterns ─────────────────────────────────────────────────────
+EMAIL_RE    = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+PHONE_RE    = re.compile(r"(?:\+?\d[\d\s\-().]{7,}\d)")
+
+# Captures full name after title: handles "Dr. A.K. Singh", "Prof. Rama Murthy",
+# "Dr. S. K. Sharma", "Prof. Mary-Jane O'Brien" — up to 5 name parts
+NAME_RE = re.compile(
+    r"\b((?:Prof(?:essor)?\.?|Dr\.?|Assoc(?:iate)?\.?\s+Prof(?:essor)?\.?|"
+    r"Asst\.?\s+Prof(?:essor)?\.?|Emeritus\s+Prof(?:essor)?\.?)"
+    r"\s+"
+    r"(?:[A-Z][a-zA-Z'\-]*\.?\s+){1,5}"   # 1-5 name parts (initials or full words)
+    r"[A-Z][a-zA-Z'\-]+)"                  # last part must be a real word (no trailing dot)
+    , re.UNICODE
+)
+
+DEPT_RE = re.compile(
+    r"(?:Department|Dept\.?|School|Faculty|Division)\s+of\s+"
+    r"([A-Z][A-Za-z\s&,]+?)(?:\.|,|\n|<)",
+    re.IGNORECASE
+)
+
+def split_keywords(keyword: str) -> list:
+    """"a, b; c" → ["a", "b", "c"]: comma/semicolon separated, stripped, no empties."""
+    return [k.strip() for k in re.split(r"[,;]+", keyword) if k.strip()]
+
+def _make_word_pattern(keyword: str) -> re.Pattern:
+    """Build a whole-word regex for a keyword. Handles short abbreviations like IoT, 5G."""
+    escaped = re.escape(keyword)
+    # Use word boundaries; for keywords ending/starting with non-word chars (5G, C++),
+    # fall back to lookaround boundaries
+    try:
+        return re.compile(r"\b" + escaped + r"\b", re.IGNORECASE)
+    except re.error:
+        return re.compile(r"(?<!\w)" + escaped + r"(?!\w)", re.IGNORECASE)
+
+# Cache compiled patterns per keyword
+_KW_PATTERN_CACHE: dict = {}
+
+def keyword_pattern(keyword: str) -> re.Pattern:
+    if keyword not in _KW_PATTERN_CACHE:
+        _KW_PATTERN_CACHE[keyword] = _make_word_pattern(keyword)
+    return _KW_PATTERN_CACHE[keyword]
+
+def extract_emails(text: str) -> list:
+    return list(dict.fromkeys(EMAIL_RE.findall(text)))
+
+def extract_phones(text: str) -> list:
+    raw = PHONE_RE.findall(text)
+    cleaned = []
+    for p in raw:
+        p = p.strip()
+        digits = re.sub(r"\D", "", p)
+        if 7 <= len(digits) <= 15:
+            cleaned.append(p)
+    return list(dict.fromkeys(cleaned))[:5]
+
+def extract_names(text: str) -> list:
+    raw = [m.group(0).strip() for m in NAME_RE.finditer(text)]
+    # Clean up excessive whitespace inside names
+    cleaned = [re.sub(r"\s{2,}", " ", n) for n in raw]
+    return list(dict.fromkeys(cleaned))[:10]
+
+def extract_departments(text: str) -> list:
+    return list(dict.fromkeys(m.group(1).strip() for m in DEPT_RE.finditer(text)))[:5]
+
+# Every place an entity can start: a phone, an email's '@', or the first word of a
+# name or department (DEPT_RE's case folding also maps 'ſ' to s and 'İ'/'ı' to i)
+ENTITY_SCAN_RE = re.compile(
+    r"\+?\d[\d\s\-().]{7,}\d|@|Prof|Dr|Assoc|Asst|Emeritus"
+    r"|[Dd][Ee][Pp]|[Ssſ][Cc][Hh]|[Ff][Aa][Cc]|[Dd][Iiİı][Vv]"
+)
+_NAME_TITLES     = frozenset(("Prof", "Dr", "Assoc", "Asst", "Emeritus"))
+_EMAIL_DOMAIN_RE = re.compile(r"[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+_EMAIL_LOCAL     = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-")
+
+def extract_entities(text: str) -> tuple:
+    """(names, emails, phones, departments) in one pass — the same lists the four
+    extract_* functions return."""
+    emails, phones, names, depts = {}, {}, {}, {}
+    email_end = name_end = dept_end = 0
+    for cand in ENTITY_SCAN_RE.finditer(text):
+        token = cand.group()
+        if len(token) > 8:          # phones are 9+ chars, every other token is shorter
+            p = token.strip()
+            if len(phones) < 5 and 7 <= sum(map(str.isdecimal, p)) <= 15:
+                phones[p] = None
+            continue
+        pos = cand.start()
+        if token == "@":
+            start = pos
+            while start > email_end and text[start - 1] in _EMAIL_LOCAL:
+                start -= 1
+            m = _EMAIL_DOMAIN_RE.match(text, pos + 1) if start < pos else None
+            if m:
+                email_end = m.end()
+                emails[text[start:email_end]] = None
+        elif token in _NAME_TITLES:
+            m = NAME_RE.match(text, pos) if pos >= name_end and len(names) < 10 else None
+            if m:
+                name_end = m.end()
+                names[re.sub(r"\s{2,}", " ", m.group(0).strip())] = None
+        else:
+            m = DEPT_RE.match(text, pos) if pos >= dept_end and len(depts) < 5 else None
+            if m:
+                dept_end = m.end()
+                depts[m.group(1).strip()] = None
+    return list(names), list(emails), list(phones), list(depts)
+
+def snippets_at(text: str, positions, keyword: str, window: int = 120, max_snippets: int = 5) -> list:
+    """Keyword-in-context snippets around already-known match offsets."""
+    snippets = []
+    for pos in positions:
+        if len(snippets) >= max_snippets:
+            break
+        start = max(0, pos - window)
+        end   = min(len(text), pos + len(keyword) + window)
+        snippet = text[start:end].replace("\n", " ").strip()
+        snippets.append(snippet)
+    return snippets
+
+def count_keyword(text: str, keyword: str) -> int:
+    """Count whole-word occurrences only — avoids 'IoT' matching 'BIoTechnology'."""
+    return len(keyword_pattern(keyword).findall(text))
+
+def _trie_pattern(words: list) -> str:
+    """Regex alternation of `words` factored into a prefix trie, e.g.
+    ['machine', 'machine learning', 'IoT'] -> (?:iot|machine(?:\\ learning)?)"""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            low = ch.lower()
+            node = node.setdefault(low if len(low) == 1 else ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if "" in node else body
+    return build(trie)
+
+# The non-ASCII letters re.IGNORECASE pairs with an ASCII one; casefold() leaves İ and ı alone
+_RE_FOLD = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "\u212a": "k"})
+
+class KeywordMatcher:
+    """Finds every keyword in one pass over the text, with the same offsets
+    per-keyword `finditer` would give."""
+
+    def __init__(self, keywords: list):
+        self.keywords = list(keywords)
+        self._patterns = [keyword_pattern(kw) for kw in self.keywords]
+        # re's case folding pairs some non-ASCII letters with ASCII ones (ı and İ
+        # with i, ſ with s), so only an ASCII letter on both sides narrows the check
+        self._unfolded = [i for i, kw in enumerate(self.keywords) if not kw[0].isascii()]
+        self._by_first: dict = {}
+        for i, kw in enumerate(self.keywords):
+            if kw[0].isascii():
+                self._by_first.setdefault(kw[0].lower(), list(self._unfolded)).append(i)
+        self._scan = re.compile(r"\b(?=" + _trie_pattern(self.keywords) + ")", re.IGNORECASE)
+        # Pre-filter probes: each keyword's longest ASCII word, which markup can't
+        # entity-encode; a keyword without one disables the pre-filter
+        probes = [max(re.findall(r"[A-Za-z0-9]+", kw), key=len, default="").casefold()
+                  for kw in self.keywords]
+        self._probes = None if "" in probes else list(dict.fromkeys(probes))
+
+    def could_match(self, html: str) -> bool:
+        """Cheap test on the raw page: False means no keyword can be in its text."""
+        if self._probes is None:
+            return True
+        if not html.isascii():
+            html = html.translate(_RE_FOLD)
+        raw = html.casefold()
+        return any(probe in raw for probe in self._probes)
+
+    def scan(self, text: str) -> list:
+        """Match offsets per keyword: a list of (start, end) lists aligned with self.keywords."""
+        hits = [[] for _ in self.keywords]
+        if not self.keywords:
+            return hits
+        every = range(len(self.keywords))
+        next_free = [0] * len(self.keywords)   # finditer never returns overlapping matches
+        for cand in self._scan.finditer(text):
+            pos = cand.start()
+            first = text[pos]
+            for i in self._by_first.get(first.lower(), self._unfolded) if first.isascii() else every:
+                if pos < next_free[i]:
+                    continue
+                m = self._patterns[i].match(text, pos)
+                if m:
+                    hits[i].append(m.span())
+                    next_free[i] = m.end()
+        return hits
+
+# ─── URL Helpers ─────────────────────────────────────────────────────────────
+SKIP_EXTENSIONS = {
+    ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
+    ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp",
+    ".zip", ".tar", ".gz", ".mp4", ".mp3", ".avi", ".mov",
+    ".css", ".js", ".woff", ".woff2", ".ttf",
+}
+
+# Query parameters that track the visitor or carry a session, never select content
+SESSION_PARAMS = {"jsessionid", "phpsessid", "aspsessionid", "cfid", "cftoken",
+                  "gclid", "fbclid", "msclkid", "mc_cid", "mc_eid"}
+_SESSION_PATH_RE = re.compile(r";(?:jsessionid|phpsessid)=[^/?#]*", re.IGNORECASE)
+_DEFAULT_PORTS   = {"http": ":80", "https": ":443"}
+
+# Crawler traps: URLs a site can generate without end
+MAX_URL_LENGTH     = 1024
+MAX_PATH_SEGMENTS  = 15
+MAX_SEGMENT_REPEAT = 3    # /a/b/a/b/a/b — relative links resolving into themselves
+CALENDAR_YEARS     = 2    # calendar pages further than this from now are not followed
+_CALENDAR_RE   = re.compile(r"(?<![a-z])(?:calendar|events?|agenda)(?![a-z])", re.IGNORECASE)
+_DATE_PATH_RE  = re.compile(r"/((?:19|20)\d\d)(?:[-_]\d\d?){0,2}(?:/\d\d?){0,2}/?$")  # /2015/03
+_DATE_PARAM_RE = re.compile(r"(?:^|[^a-z])(?:date|day|week|month|year)s?(?:[^a-z]|$)", re.IGNORECASE)
+_YEAR_RE       = re.compile(r"(?<!\d)(?:19|20)\d\d(?!\d)")
+
+def _calendar_years(parts) -> list:
+    """Years a calendar URL navigates to: the date its path ends in, or the value
+    of a date-style query or path parameter (?month=2015-03, ;year=2015)."""
+    if not _CALENDAR_RE.search(parts.path + "?" + parts.query):
+        return []
+    segments = parts.path.split("/")
+    params = parts.query.split("&") + [p for seg in segments for p in seg.split(";")[1:]]
+    years = [year for name, _, value in (p.partition("=") for p in params)
+             if _DATE_PARAM_RE.search(name) for year in _YEAR_RE.findall(value)]
+    m = _DATE_PATH_RE.search("/".join(seg.split(";")[0] for seg in segments))
+    if m:
+        years.append(m.group(1))
+    return years
+
+def is_crawler_trap(parts) -> bool:
+    """True for an (urlsplit) URL that looks machine-generated without end: overlong,
+    too deep, repeating its own path segments, or a calendar page years away."""
+    if len(parts.path) + len(parts.query) > MAX_URL_LENGTH:
+        return True
+    segments = [seg for seg in parts.path.split("/") if seg]
+    if len(segments) > MAX_PATH_SEGMENTS:
+        return True
+    if len(segments) >= MAX_SEGMENT_REPEAT and \
+            max(segments.count(seg) for seg in set(segments)) >= MAX_SEGMENT_REPEAT:
+        return True
+    this_year = datetime.now().year
+    return any(abs(int(year) - this_year) > CALENDAR_YEARS for year in _calendar_years(parts))
+
+def _in_scope(parts, base_domain: str, allow_subdomains: bool) -> bool:
+    """is_valid_url on an already-split URL (urlsplit result)."""
+    if parts.scheme not in ("http", "https"):
+        return False
+    domain = parts.netloc.lower()
+    if allow_subdomains:
+        if not (domain == base_domain or domain.endswith("." + base_domain)):
+            return False
+    else:
+        if domain != base_domain:
+            return False
+    ext = os.path.splitext(parts.path.split(";")[0].lower())[1]
+    if ext in SKIP_EXTENSIONS:
+        return False
+    return not is_crawler_trap(parts)
+
+def is_valid_url(url: str, base_domain: str, allow_subdomains: bool = False) -> bool:
+    try:
+        return _in_scope(urlsplit(url), base_domain, allow_subdomains)
+    except Exception:
+        return False
+
+def _is_session_param(param: str) -> bool:
+    name = param.split("=", 1)[0].lower()
+    return name.startswith("utm_") or name in SESSION_PARAMS
+
+def _remove_dot_segments(path: str) -> str:
+    """Resolve `.` and `..` segments of an absolute path."""
+    out = []
+    for seg in path.split("/"):
+        if seg == "..":
+            if len(out) > 1:
+                out.pop()
+        elif seg != ".":
+            out.append(seg)
+    return "/".join(out)
+
+def _merge_path(base_path: str, path: str) -> str:
+    """The path urljoin gives `path` against `base_path`, dot segments resolved."""
+    if path.startswith("/"):
+        segments = path.split("/")
+    else:
+        segments = base_path.split("/")
+        if segments[-1]:
+            del segments[-1]     # the base's last segment is a file, not a directory
+        segments += path.split("/")
+        segments[1:-1] = filter(None, segments[1:-1])   # urljoin collapses `//` here
+    out = []
+    for seg in segments:
+        if seg == "..":
+            if out:
+                out.pop()
+        elif seg != ".":
+            out.append(seg)
+    if segments[-1] in (".", ".."):
+        out.append("")
+    path = "/".join(out)
+    return path if path.startswith("/") else "/" + path   # as urlunsplit roots it under the host
+
+def normalize_url(url: str) -> str:
+    """Canonical spelling of a URL, so a page linked in different ways is fetched
+    once: scheme and host lower-cased, default port, fragment, session and tracking
+    parameters dropped, `.`/`..` segments resolved, the remaining query parameters
+    sorted and the trailing slash removed."""
+    scheme, netloc, path, query, _ = urlsplit(url)
+    return urlunsplit(_canonical_parts(scheme, netloc, path, query))
+
+def _canonical_parts(scheme: str, netloc: str, path: str, query: str) -> SplitResult:
+    scheme = scheme.lower()
+    userinfo, at, host = netloc.rpartition("@")
+    host = host.lower()
+    port = _DEFAULT_PORTS.get(scheme)
+    if port and host.endswith(port):
+        host = host[:-len(port)]
+    if ";" in path:
+        path = _SESSION_PATH_RE.sub("", path)
+    if "/." in path:
+        path = _remove_dot_segments(path)
+    if query:
+        query = "&".join(sorted(p for p in query.split("&") if p and not _is_session_param(p)))
+    return SplitResult(scheme, userinfo + at + host, path.rstrip("/"), query, "")
+
+def _resolve(base: SplitResult, href: str) -> SplitResult:
+    """urljoin(base, href) followed by normalize_url, for a base split only once
+    per page instead of once per link (RFC 3986 section 5.2)."""
+    scheme, netloc, path, query, _ = urlsplit(href)
+    if scheme and scheme.lower() != base.scheme.lower():
+        return _canonical_parts(scheme, netloc, path, query)
+    if not netloc:
+        netloc = base.netloc
+        if not path:
+            path = base.path
+            query = query or base.query
+        else:
+            path = _merge_path(base.path, path)
+    return _canonical_parts(base.scheme, netloc, path, query)
+
+class _HrefCollector:
+    """lxml parser target that keeps the distinct <a href> values and builds no tree.
+    With `anchors`, hrefs map to the text of their <a> elements instead of None."""
+
+    def __init__(self, anchors: bool = False):
+        self.hrefs: dict = {}
+        self.anchors = anchors
+        self._open: Optional[str] = None    # href of the <a> being read
+
+    def start(self, tag, attrib):
+        if tag == "a":
+            href = attrib.get("href")
+            if href is not None:
+                if self.anchors:
+                    self.hrefs.setdefault(href, [])
+                    self._open = href
+                else:
+                    self.hrefs[href] = None
+
+    def end(self, tag):
+        if tag == "a":
+            self._open = None
+
+    def data(self, data):
+        if self._open is not None:
+            self.hrefs[self._open].append(data)
+
+    def close(self):
+        return list(self.hrefs)
+
+def extract_links(html: str, page_url: str, base_domain: str,
+                  allow_subdomains: bool = False, anchors: bool = False) -> list:
+    """In-scope, normalized links of a page, in document order and without repeats;
+    with `anchors`, (link, anchor text) pairs.
+
+    Streams the markup through lxml's parser straight into _HrefCollector, so no
+    tree is built, and repeated hrefs (navigation menus) are resolved only once.
+    The page URL is split once and each href resolved against it straight into
+    canonical parts, which the scheme, domain, extension and trap checks reuse."""
+    collector = _HrefCollector(anchors)
+    parser = etree.HTMLParser(target=collector, recover=True, no_network=True)
+    try:
+        parser.feed(html)
+        hrefs = parser.close()
+    except etree.LxmlError:
+        hrefs = list(collector.hrefs)
+
+    links: dict = {}
+    rejected = set()
+    base = urlsplit(page_url)
+    for href in hrefs:
+        try:
+            parts = _resolve(base, href)
+            full_url = urlunsplit(parts)
+            if full_url in links or full_url in rejected:
+                continue
+            if _in_scope(parts, base_domain, allow_subdomains):
+                links[full_url] = href
+            else:
+                rejected.add(full_url)
+        except ValueError:      # malformed href, e.g. an unterminated [IPv6] host
+            continue
+    if anchors:
+        return [(link, " ".join(" ".join(collector.hrefs[href]).split()))
+                for link, href in links.items()]
+    return list(links)
+
+# ─── Link Scoring ────────────────────────────────────────────────────────────
+# URL words that mark the pages this tool is after
+HINT_TOKENS = {
+    "faculty", "people", "person", "staff", "profile", "profiles", "directory",
+    "professor", "professors", "research", "researchers", "department", "dept",
+    "lab", "labs", "group", "groups", "team", "members", "homepage", "academics",
+}
+_URL_WORD_RE = re.compile(r"[a-z]+")
+
+def score_links(links: list, matcher: KeywordMatcher, parent_density: float = 0.0) -> list:
+    """[(link, anchor text)] → [(link, score)] for best-first crawling. A link gains
+    3 per keyword in its anchor text, 2 per keyword in its URL, 1 per hint word in
+    its URL (HINT_TOKENS, at most 2) and up to 2 for the parent page's keyword
+    density (hits per 1,000 words, saturating at 20)."""
+    inherited = min(parent_density, 20.0) / 10
+    scored = []
+    for link, anchor in links:
+        score = inherited
+        if anchor:
+            score += 3 * sum(1 for spans in matcher.scan(anchor) if spans)
+        path = urlsplit(link)
+        words = _URL_WORD_RE.findall((path.path + " " + path.query).lower())
+        score += 2 * sum(1 for spans in matcher.scan(" ".join(words)) if spans)
+        score += min(2, sum(1 for w in words if w in HINT_TOKENS))
+        scored.append((link, score))
+    return scored
+
+# ─── HTTP Session ─────────────────────────────────────────────────────────────
+def make_session(timeout: int = 10, pool_size: int = 10, hosts: int = 32) -> requests.Session:
+    session = requests.Session()
+    # One keep-alive pool shared by every worker; size it so no worker has to
+    # open a throwaway connection when all of them hit the same host, and keep
+    # a per-host pool for every host so interleaved seeds don't evict each other
+    adapter = requests.adapters.HTTPAdapter(pool_connections=hosts, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0.0.0 Safari/537.36"
+        ),
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Connection": "keep-alive",
+    })
+    return session
+
+def _retry_after(headers, attempt: int) -> float:
+    """Seconds to wait after a 429: the server's Retry-After if numeric, else 2^attempt."""
+    try:
+        return min(float(headers.get("Retry-After", "")), 120.0)
+    except ValueError:
+        return float(2 ** attempt)
+
+class RateLimited(Exception):
+    """A 429 from a host the limiter manages. The limiter has already backed the
+    host off, so the caller re-queues the page instead of sleeping on it."""
+
+def fetch_page(session: requests.Session, url: str, timeout: int = 10,
+               retries: int = 3, logger: logging.Logger = None,
+               limiter: "HostRateLimiter" = None,
+               cache: "HttpCache" = None) -> Optional[requests.Response]:
+    conditional = cache.validators(url) if cache else {}
+    for attempt in range(1, retries + 1):
+        try:
+            resp = session.get(url, timeout=timeout, verify=False, allow_redirects=True,
+                               headers=conditional)
+            if resp.status_code == 200:
+                if limiter: limiter.recover(urlsplit(url).netloc)
+                if cache: cache.store(url, resp.headers, resp.content, resp.encoding)
+                return resp
+            if resp.status_code == 304 and conditional:
+                if limiter: limiter.recover(urlsplit(url).netloc)
+                return cache.load(url)
+            if resp.status_code in (403, 404, 410):
+                return None
+            if resp.status_code == 429:
+                wait = _retry_after(resp.headers, attempt)
+                if limiter:
+                    limiter.backoff(urlsplit(url).netloc, wait)
+                    if logger: logger.warning(f"Rate limited on {url}, host paused {wait}s")
+                    raise RateLimited(url)
+                if logger: logger.warning(f"Rate limited on {url}, waiting {wait}s")
+                time.sleep(wait)
+        except RateLimited:
+            raise
+        except requests.exceptions.Timeout:
+            if logger: logger.debug(f"Timeout on {url} (attempt {attempt})")
+        except requests.exceptions.ConnectionError:
+            if logger: logger.debug(f"Connection error on {url} (attempt {attempt})")
+        except Exception as e:
+            if logger: logger.debug(f"Error fetching {url}: {e}")
+            return None
+        if attempt < retries:
+            time.sleep(0.5 * attempt)
+    return None
+
+async def fetch_page_async(session, url: str, retries: int = 3,
+                           logger: logging.Logger = None,
+                           limiter: "HostRateLimiter" = None,
+                           cache: "HttpCache" = None) -> Optional[tuple]:
+    """aiohttp twin of fetch_page. Returns (content_type, text) for a 200 response —
+    text is only read for HTML — or None when the page could not be fetched."""
+    conditional = cache.validators(url) if cache else {}
+    for attempt in range(1, retries + 1):
+        try:
+            async with session.get(url, allow_redirects=True, headers=conditional) as resp:
+                if resp.status == 200:
+                    if limiter: limiter.recover(urlsplit(url).netloc)
+                    content_type = resp.headers.get("Content-Type", "")
+                    if "text/html" not in content_type:
+                        return content_type, ""
+                    text = await resp.text(errors="replace")
+                    if cache: cache.store(url, resp.headers, text.encode("utf-8"), "utf-8")
+                    return content_type, text
+                if resp.status == 304 and conditional:
+                    if limiter: limiter.recover(urlsplit(url).netloc)
+                    cached = cache.load(url)
+                    return (cached.headers["Content-Type"], cached.text) if cached else None
+                if resp.status in (403, 404, 410):
+                    return None
+                if resp.status == 429:
+                    wait = _retry_after(resp.headers, attempt)
+                    if limiter:
+                        limiter.backoff(urlsplit(url).netloc, wait)
+                        if logger: logger.warning(f"Rate limited on {url}, host paused {wait}s")
+                        raise RateLimited(url)
+                    if logger: logger.warning(f"Rate limited on {url}, waiting {wait}s")
+                    await asyncio.sleep(wait)
+        except RateLimited:
+            raise
+        except asyncio.TimeoutError:
+            if logger: logger.debug(f"Timeout on {url} (attempt {attempt})")
+        except aiohttp.ClientConnectionError:
+            if logger: logger.debug(f"Connection error on {url} (attempt {attempt})")
+        except Exception as e:
+            if logger: logger.debug(f"Error fetching {url}: {e}")
+            return None
+        if attempt < retries:
+            await asyncio.sleep(0.5 * attempt)
+    return None
+
+# ─── HTTP Cache ──────────────────────────────────────────────────────────────
+HTTP_CACHE_FILE = ".http_cache.sqlite"
+
+class HttpCache:
+    """On-disk store of HTML responses keyed by normalized URL. Pages are kept with
+    their ETag / Last-Modified so the next crawl can revalidate them with a
+    conditional GET — a 304 then costs one round trip and no body. Responses
+    without either validator are not stored, since they can't be revalidated."""
+
+    def __init__(self, path: str = HTTP_CACHE_FILE):
+        self.path = path
+        self.lock = Lock()
+        self.db   = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT,"
+            " content_type TEXT, encoding TEXT, body BLOB, fetched_at REAL)")
+        self.db.commit()
+        self.hits   = 0   # 304s answered from the store
+        self.stored = 0
+
+    def validators(self, url: str) -> dict:
+        """Conditional request headers for a stored page; {} if it isn't stored."""
+        with self.lock:
+            row = self.db.execute("SELECT etag, last_modified FROM pages WHERE url = ?",
+                                  (normalize_url(url),)).fetchone()
+        headers = {}
+        if row:
+            if row[0]: headers["If-None-Match"] = row[0]
+            if row[1]: headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def load(self, url: str) -> Optional[requests.Response]:
+        """The stored page rebuilt as a 200 Response, for a server that answered 304."""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT content_type, encoding, body, etag, last_modified FROM pages WHERE url = ?",
+                (normalize_url(url),)).fetchone()
+            if row is None:
+                return None
+            self.hits += 1
+        content_type, encoding, body, etag, last_modified = row
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url         = url
+        resp._content    = body
+        resp.encoding    = encoding
+        resp.headers.update({"Content-Type": content_type})
+        if etag: resp.headers["ETag"] = etag
+        if last_modified: resp.headers["Last-Modified"] = last_modified
+        return resp
+
+    def store(self, url: str, headers, body: bytes, encoding: Optional[str]):
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        content_type = headers.get("Content-Type", "")
+        if not (etag or last_modified) or "text/html" not in content_type:
+            return
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), etag, last_modified, content_type, encoding,
+                 body, time.time()))
+            self.db.commit()
+            self.stored += 1
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+# ─── Politeness ──────────────────────────────────────────────────────────────
+class TokenBucket:
+    """Holds up to `burst` tokens, refilled at one token per `interval` seconds."""
+
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self.burst    = burst
+        self.tokens   = float(burst)
+        self.stamp    = time.monotonic()
+
+    def _refill(self, now: float):
+        if self.interval <= 0:
+            self.tokens = float(self.burst)
+        else:
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) / self.interval)
+        self.stamp = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token is available (0.0 if one is available now)."""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) * self.interval
+
+    def try_take(self, now: float) -> bool:
+        if self.wait_time(now) > 0:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class HostRateLimiter:
+    """One token bucket per netloc, so each host sees at most one request per
+    `delay` seconds no matter how many workers are running. A 429 doubles that
+    host's interval (up to `max_delay`) and blocks it for the Retry-After time;
+    every successful fetch eases the interval back towards `delay`."""
+
+    def __init__(self, delay: float, burst: int = 1, max_delay: float = 60.0):
+        self.delay     = delay
+        self.burst     = burst
+        self.max_delay = max_delay
+        self.buckets: dict = {}
+        self.lock      = Lock()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = self.buckets[host] = TokenBucket(self.delay, self.burst)
+        return bucket
+
+    def try_acquire(self, host: str) -> bool:
+        """Take a token for `host` if one is available right now."""
+        with self.lock:
+            return self._bucket(host).try_take(time.monotonic())
+
+    def wait_time(self, host: str) -> float:
+        with self.lock:
+            return self._bucket(host).wait_time(time.monotonic())
+
+    def backoff(self, host: str, wait: float):
+        with self.lock:
+            bucket = self._bucket(host)
+            bucket._refill(time.monotonic())
+            bucket.interval = min(self.max_delay, max(bucket.interval * 2, 1.0))
+            bucket.tokens   = 1 - wait / bucket.interval   # blocked for `wait` seconds
+
+    def recover(self, host: str):
+        with self.lock:
+            bucket = self._bucket(host)
+            if bucket.interval > self.delay:
+                bucket.interval = max(self.delay, bucket.interval * 0.75)
+
+# ─── Frontier ────────────────────────────────────────────────────────────────
+class HostFrontier:
+    """BFS frontier split into one FIFO per host. pop() walks the hosts round-robin
+    and takes from the first one whose `ready(host)` check passes, so a throttled
+    or slow host never holds up work that is allowed to go to another. Items are
+    (url, depth, seed, score) tuples, `seed` being an index into the crawler's
+    seeds; BFS ignores the score but keeps it, so a requeued page keeps it too."""
+
+    def __init__(self):
+        self._queues: dict = {}
+        self._hosts  = deque()
+        self._size   = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def hosts(self) -> list:
+        return list(self._hosts)
+
+    def push(self, url: str, depth: int, seed: int = 0, score: float = 0.0):
+        host = urlsplit(url).netloc.lower()
+        queue = self._queues.get(host)
+        if queue is None:
+            queue = self._queues[host] = deque()
+            self._hosts.append(host)
+        queue.append((url, depth, seed, score))
+        self._size += 1
+
+    def pop(self, ready=None) -> Optional[tuple]:
+        """Next item from a ready host, or None if every host must wait."""
+        for _ in range(len(self._hosts)):
+            host = self._hosts[0]
+            self._hosts.rotate(-1)
+            if ready is None or ready(host):
+                queue = self._queues[host]
+                item = queue.popleft()
+                if not queue:
+                    del self._queues[host]
+                    self._hosts.remove(host)
+                self._size -= 1
+                return item
+        return None
+
+    def remove_if(self, predicate):
+        """Drop every queued item for which predicate(item) is true."""
+        for host in list(self._hosts):
+            queue = self._queues[host]
+            kept = deque(item for item in queue if not predicate(item))
+            self._size -= len(queue) - len(kept)
+            if kept:
+                self._queues[host] = kept
+            else:
+                del self._queues[host]
+                self._hosts.remove(host)
+
+    def clear(self):
+        self._queues.clear()
+        self._hosts.clear()
+        self._size = 0
+
+    def __iter__(self):
+        for host in self._hosts:
+            yield from self._queues[host]
+
+    def close(self):
+        pass
+
+class PriorityFrontier:
+    """Best-first frontier: one max-heap on link score per host. pop() offers hosts to
+    `ready` in order of their best queued score and takes from the first that
+    passes, so politeness still holds but the most promising link goes first.
+    Equal scores come out in the order they were queued."""
+
+    def __init__(self):
+        self._heaps: dict = {}
+        self._order = itertools.count()
+        self._size  = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def hosts(self) -> list:
+        return list(self._heaps)
+
+    def push(self, url: str, depth: int, seed: int = 0, score: float = 0.0):
+        host = urlsplit(url).netloc.lower()
+        heapq.heappush(self._heaps.setdefault(host, []),
+                       (-score, next(self._order), url, depth, seed))
+        self._size += 1
+
+    def pop(self, ready=None) -> Optional[tuple]:
+        """Best item from a ready host, or None if every host must wait."""
+        for host in sorted(self._heaps, key=lambda h: self._heaps[h][0]):
+            if ready is None or ready(host):
+                heap = self._heaps[host]
+                neg_score, _, url, depth, seed = heapq.heappop(heap)
+                if not heap:
+                    del self._heaps[host]
+                self._size -= 1
+                return url, depth, seed, -neg_score
+        return None
+
+    def remove_if(self, predicate):
+        """Drop every queued item for which predicate(item) is true."""
+        for host in list(self._heaps):
+            kept = [entry for entry in self._heaps[host] if not predicate(entry[2:])]
+            self._size -= len(self._heaps[host]) - len(kept)
+            if kept:
+                heapq.heapify(kept)
+                self._heaps[host] = kept
+            else:
+                del self._heaps[host]
+
+    def clear(self):
+        self._heaps.clear()
+        self._size = 0
+
+    def __iter__(self):
+        for heap in self._heaps.values():
+            for neg_score, _, url, depth, seed in sorted(heap):
+                yield url, depth, seed, -neg_score
+
+    def close(self):
+        pass
+
+class DiskFrontier:
+    """HostFrontier whose queue lives in an SQLite file, for frontiers too large to
+    keep in memory. Same interface and the same round-robin over hosts, with
+    items in BFS order within a host (lowest depth first, then first queued);
+    rows are read `block` at a time per host, so most pops don't touch the disk.
+    With `best_first` it orders like PriorityFrontier instead: hosts are offered
+    in order of their best queued score and each gives its highest-scored row.
+    The file is a scratch copy (crash recovery is --jobdir's job) and close()
+    deletes it."""
+
+    def __init__(self, path: Optional[str] = None, block: int = 256, best_first: bool = False):
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="frontier-", suffix=".sqlite")
+            os.close(fd)
+        self.path  = path
+        # A best-first pop must see links queued since the last read, so read singly
+        self.block = 1 if best_first else block
+        self.best_first = best_first
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=OFF")
+        self.db.execute("PRAGMA synchronous=OFF")
+        self.db.execute("DROP TABLE IF EXISTS frontier")
+        self.db.execute("CREATE TABLE frontier (id INTEGER PRIMARY KEY, host TEXT,"
+                        " url TEXT, depth INTEGER, seed INTEGER, score REAL, rank REAL)")
+        self.db.execute("CREATE INDEX frontier_order ON frontier (host, rank, id)")
+        self._counts: dict  = {}    # host -> items queued, buffered or on disk
+        self._buffers: dict = {}    # host -> deque of items already read off disk
+        self._heads: dict   = {}    # host -> (rank, id) of its next row, with best_first
+        self._hosts = deque()
+        self._size  = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def hosts(self) -> list:
+        return list(self._hosts)
+
+    def push(self, url: str, depth: int, seed: int = 0, score: float = 0.0):
+        host = urlsplit(url).netloc.lower()
+        rank = -score if self.best_first else depth
+        row = self.db.execute("INSERT INTO frontier (host, url, depth, seed, score, rank)"
+                              " VALUES (?, ?, ?, ?, ?, ?)", (host, url, depth, seed, score, rank))
+        if self.best_first and (rank, row.lastrowid) < self._heads.get(host, (math.inf, 0)):
+            self._heads[host] = (rank, row.lastrowid)
+        if host not in self._counts:
+            self._counts[host] = 0
+            self._hosts.append(host)
+        self._counts[host] += 1
+        self._size += 1
+
+    def _take(self, host: str) -> tuple:
+        buffer = self._buffers.get(host)
+        if not buffer:
+            rows = self.db.execute(
+                "SELECT id, url, depth, seed, score FROM frontier WHERE host = ?"
+                " ORDER BY rank, id LIMIT ?", (host, self.block)).fetchall()
+            self.db.executemany("DELETE FROM frontier WHERE id = ?", [(r[0],) for r in rows])
+            buffer = self._buffers[host] = deque(tuple(r[1:]) for r in rows)
+        return buffer.popleft()
+
+    def _head(self, host: str) -> tuple:
+        return self.db.execute("SELECT rank, id FROM frontier WHERE host = ?"
+                               " ORDER BY rank, id LIMIT 1", (host,)).fetchone()
+
+    def _offer(self):
+        """Hosts in the order pop() offers them to `ready`."""
+        if self.best_first:
+            yield from sorted(self._heads, key=self._heads.get)
+            return
+        for _ in range(len(self._hosts)):
+            host = self._hosts[0]
+            self._hosts.rotate(-1)
+            yield host
+
+    def pop(self, ready=None) -> Optional[tuple]:
+        """Next item from a ready host, or None if every host must wait."""
+        for host in self._offer():
+            if ready is None or ready(host):
+                item = self._take(host)
+                self._counts[host] -= 1
+                if not self._counts[host]:
+                    del self._counts[host]
+                    self._buffers.pop(host, None)
+                    self._heads.pop(host, None)
+                    self._hosts.remove(host)
+                elif self.best_first:
+                    self._heads[host] = self._head(host)
+                self._size -= 1
+                return item
+        return None
+
+    def buffered(self) -> list:
+        """Items already read off disk, which backup() doesn't copy."""
+        return [item for buffer in self._buffers.values() for item in buffer]
+
+    def backup(self, path: str):
+        """Copy the queue on disk to an SQLite file at `path`, a page at a time."""
+        dest = sqlite3.connect(path)
+        try:
+            self.db.backup(dest)
+        finally:
+            dest.close()
+
+    def remove_if(self, predicate):
+        """Drop every queued item for which predicate(item) is true."""
+        for host, buffer in list(self._buffers.items()):
+            self._buffers[host] = deque(item for item in buffer if not predicate(item))
+        doomed = [(row[0],) for row in self.db.execute("SELECT id, url, depth, seed FROM frontier")
+                  if predicate(tuple(row[1:]))]
+        self.db.executemany("DELETE FROM frontier WHERE id = ?", doomed)
+        counts = dict(self.db.execute("SELECT host, COUNT(*) FROM frontier GROUP BY host"))
+        for host, buffer in self._buffers.items():
+            counts[host] = counts.get(host, 0) + len(buffer)
+        self._counts  = {host: n for host, n in counts.items() if n}
+        self._buffers = {host: b for host, b in self._buffers.items() if b}
+        self._hosts   = deque(host for host in self._hosts if host in self._counts)
+        self._size    = sum(self._counts.values())
+        if self.best_first:
+            self._heads = {host: self._head(host) for host in self._counts}
+
+    def clear(self):
+        self.db.execute("DELETE FROM frontier")
+        self._counts.clear()
+        self._buffers.clear()
+        self._heads.clear()
+        self._hosts.clear()
+        self._size = 0
+
+    def __iter__(self):
+        for host in self._hosts:
+            yield from self._buffers.get(host, ())
+            yield from (tuple(row) for row in self.db.execute(
+                "SELECT url, depth, seed, score FROM frontier WHERE host = ? ORDER BY rank, id",
+                (host,)))
+
+    def close(self):
+        self.db.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+FRONTIER_KINDS = ("memory", "disk")
+STRATEGIES     = ("bfs", "best-first")
+
+def make_frontier(kind: str = "memory", strategy: str = "bfs"):
+    best_first = strategy == "best-first"
+    if kind == "disk":
+        return DiskFrontier(best_first=best_first)
+    return PriorityFrontier() if best_first else HostFrontier()
+
+# ─── Visited Sets ────────────────────────────────────────────────────────────
+# A set of URL strings costs ~150 bytes per URL; these trade exactness for a
+# fraction of that on very large crawls. Both support `in`, add() and len().
+VISITED_KINDS = ("set", "hashes", "bloom")
+
+def _url_digest(url: str) -> bytes:
+    return hashlib.blake2b(url.encode("utf-8", "replace"), digest_size=16).digest()
+
+class URLHashSet:
+    """Open-addressing table of 64-bit URL hashes in a flat array — 12–24 bytes per
+    URL. Two URLs collide with probability ~n/2^64, i.e. never in practice."""
+
+    def __init__(self, capacity: int = 1 << 16):
+        self.table = array("Q", bytes(8 * capacity))
+        self.mask  = capacity - 1
+        self.count = 0
+
+    @staticmethod
+    def _hash(url: str) -> int:
+        return int.from_bytes(_url_digest(url)[:8], "little") or 1   # 0 marks an empty slot
+
+    def _slot(self, h: int) -> int:
+        table, mask = self.table, self.mask
+        i = h & mask
+        while table[i] and table[i] != h:
+            i = (i + 1) & mask
+        return i
+
+    def __contains__(self, url: str) -> bool:
+        h = self._hash(url)
+        return self.table[self._slot(h)] == h
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, url: str):
+        self._insert(self._hash(url))
+
+    def _insert(self, h: int):
+        i = self._slot(h)
+        if self.table[i] == h:
+            return
+        self.table[i] = h
+        self.count += 1
+        if self.count * 3 > len(self.table) * 2:    # keep probes short: load <= 2/3
+            old = self.table
+            self.table = array("Q", bytes(16 * len(old)))
+            self.mask  = len(self.table) - 1
+            self.count = 0
+            for h in old:
+                if h:
+                    self._insert(h)
+
+    def to_state(self) -> dict:
+        return {"kind": "hashes", "table": base64.b64encode(self.table.tobytes()).decode("ascii"),
+                "count": self.count}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "URLHashSet":
+        visited = cls(1)
+        visited.table = array("Q")
+        visited.table.frombytes(base64.b64decode(state["table"]))
+        visited.mask  = len(visited.table) - 1
+        visited.count = state["count"]
+        return visited
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for `capacity` items at `fp_rate` false positives."""
+
+    def __init__(self, capacity: int, fp_rate: float):
+        self.capacity = capacity
+        self.fp_rate  = fp_rate
+        self.size     = max(64, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.hashes   = max(1, round(self.size / capacity * math.log(2)))
+        self.bits     = bytearray((self.size + 7) // 8)
+        self.count    = 0
+
+    # Double hashing: the k bit positions are h1, h1 + h2, h1 + 2·h2, ... mod size,
+    # from the two 64-bit halves of one digest
+    def contains(self, h1: int, h2: int) -> bool:
+        bits, size = self.bits, self.size
+        p, step = h1 % size, h2 % size or 1
+        for _ in range(self.hashes):
+            if not bits[p >> 3] >> (p & 7) & 1:
+                return False
+            p += step
+            if p >= size:
+                p -= size
+        return True
+
+    def add(self, h1: int, h2: int):
+        bits, size = self.bits, self.size
+        p, step = h1 % size, h2 % size or 1
+        for _ in range(self.hashes):
+            bits[p >> 3] |= 1 << (p & 7)
+            p += step
+            if p >= size:
+                p -= size
+        self.count += 1
+
+class ScalableBloomFilter:
+    """Bloom filter that grows with the crawl: when the newest slice is full a slice
+    twice its size at half its false-positive rate is added, which keeps the overall
+    rate under `fp_rate` however many URLs arrive (Almeida et al., 2007). A false
+    positive makes the crawler skip a URL it never fetched."""
+
+    def __init__(self, fp_rate: float = 0.001, initial_capacity: int = 1 << 16):
+        self.fp_rate = fp_rate
+        # Slice rates fp/2, fp/4, ... sum to at most fp
+        self.filters = [BloomFilter(initial_capacity, fp_rate / 2)]
+
+    @staticmethod
+    def _hashes(url: str) -> tuple:
+        digest = _url_digest(url)
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+    def __contains__(self, url: str) -> bool:
+        h1, h2 = self._hashes(url)
+        return any(f.contains(h1, h2) for f in reversed(self.filters))
+
+    def __len__(self) -> int:
+        return sum(f.count for f in self.filters)
+
+    def add(self, url: str):
+        """Add a URL known not to be present (callers test `in` first)."""
+        last = self.filters[-1]
+        if last.count >= last.capacity:
+            last = BloomFilter(last.capacity * 2, last.fp_rate / 2)
+            self.filters.append(last)
+        last.add(*self._hashes(url))
+
+    def to_state(self) -> dict:
+        return {"kind": "bloom", "fp_rate": self.fp_rate, "filters": [
+            [f.capacity, f.fp_rate, f.count, base64.b64encode(bytes(f.bits)).decode("ascii")]
+            for f in self.filters]}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "ScalableBloomFilter":
+        visited = cls(state["fp_rate"])
+        visited.filters = []
+        for capacity, fp_rate, count, bits in state["filters"]:
+            f = BloomFilter(capacity, fp_rate)
+            f.bits, f.count = bytearray(base64.b64decode(bits)), count
+            visited.filters.append(f)
+        return visited
+
+def make_visited(kind: str = "set", fp_rate: float = 0.001):
+    """Visited-URL store: "set" (exact), "hashes" (URLHashSet) or "bloom"
+    (ScalableBloomFilter with the given false-positive rate)."""
+    if kind == "hashes":
+        return URLHashSet()
+    if kind == "bloom":
+        return ScalableBloomFilter(fp_rate)
+    return set()
+
+def visited_state(visited):
+    return list(visited) if isinstance(visited, set) else visited.to_state()
+
+def visited_from_state(state):
+    if isinstance(state, list):
+        return set(state)
+    return {"hashes": URLHashSet, "bloom": ScalableBloomFilter}[state["kind"]].from_state(state)
+
+# ─── Page Analysis ───────────────────────────────────────────────────────────
+def analyze_page(html: str, url: str, depth: int, matcher: KeywordMatcher,
+                 site: Seed, score: bool = False) -> tuple:
+    """The CPU-bound part of a crawl step, kept free of crawler state so it can run
+    on a fetch thread or in a worker process alike.
+    Returns (PageResult or None, in-scope links, prefiltered); with `score` the
+    links are (link, score) pairs from score_links."""
+    want_links = depth < site.max_depth
+
+    def links_of(density: float = 0.0) -> list:
+        if not want_links:
+            return []
+        if score:
+            return score_links(extract_links(html, url, site.base_domain, site.allow_subdomains,
+                                             anchors=True), matcher, density)
+        return extract_links(html, url, site.base_domain, site.allow_subdomains)
+
+    if not matcher.could_match(html):
+        # Cheap path: no keyword can match, so skip text extraction entirely
+        return None, links_of(), True
+
+    soup  = BeautifulSoup(html, "lxml")
+    text  = soup.get_text(separator=" ")
+    title = soup.title.string.strip() if soup.title and soup.title.string else ""
+
+    hits = matcher.scan(text)
+    kw_count = sum(len(spans) for spans in hits)
+    result = None
+
+    if kw_count > 0:
+        # Gather snippets for each matched keyword
+        all_snippets = []
+        matched_kws = []
+        for kw, spans in zip(matcher.keywords, hits):
+            if spans:
+                matched_kws.append(kw)
+                all_snippets.extend(snippets_at(text, (a for a, _ in spans), kw, max_snippets=2))
+
+        names, emails, phones, departments = extract_entities(text)
+        result = PageResult(
+            url=url,
+            names=names,
+            emails=emails,
+            phones=phones,
+            departments=departments,
+            matched_snippets=all_snippets,
+            keyword_count=kw_count,
+            page_title=title,
+            depth=depth,
+            seed=site.url,
+        )
+        result.matched_keywords = matched_kws  # store which keywords hit
+
+    return result, links_of(kw_count * 1000 / (text.count(" ") + 1)), False
+
+# Worker processes build each keyword set's matcher once and reuse it
+_MATCHERS: dict = {}
+
+def parse_batch(keywords: tuple, batch: list, score: bool = False,
+                fingerprint: bool = False) -> list:
+    """Process-pool entry point: [(simhash or None, analyze_page outcome or None)] for
+    [(url, depth, html, site, analyze), ...]. Pages are only fingerprinted with
+    `fingerprint`, and only analyzed when their `analyze` flag is set."""
+    matcher = _MATCHERS.get(keywords)
+    if matcher is None:
+        matcher = _MATCHERS[keywords] = KeywordMatcher(keywords)
+    return [(simhash(html) if fingerprint else None,
+             analyze_page(html, url, depth, matcher, site, score) if analyze else None)
+            for url, depth, html, site, analyze in batch]
+
+# ─── Checkpoints ─────────────────────────────────────────────────────────────
+class JobCheckpoint:
+    """Crawl state kept in a job directory so an interrupted crawl can resume:
+    job.json holds the options the crawl was started with, state.json the
+    frontier, visited set and stats as of the last checkpoint. Both are replaced
+    atomically, so a crash mid-write leaves the previous state intact.
+
+    Checkpoints are mostly incremental: results are appended to results.jsonl
+    (state.json records how much of it is valid), and a DiskFrontier is copied
+    into the job directory with SQLite's backup, never read into memory. The
+    visited set is still written whole each time, so with --visited set a
+    checkpoint costs time and transient memory in proportion to the crawl;
+    hashes and bloom keep that to their fixed-size tables."""
+
+    def __init__(self, jobdir: str, interval: float = 30.0):
+        self.jobdir   = jobdir
+        self.interval = interval
+        self.last     = time.monotonic()
+        self._taken   = 0                     # crawler.results already looked at
+        self._held: list = []                 # results of pages in flight at the last save
+        self._matched = Counter()             # seed url -> results in results.jsonl
+        self._offset: Optional[int] = None    # valid bytes of results.jsonl; None: not started
+        self._frontier_file: Optional[str] = None
+        os.makedirs(jobdir, exist_ok=True)
+
+    def _write(self, name: str, data: dict):
+        path = os.path.join(self.jobdir, name)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+
+    def _read(self, name: str) -> Optional[dict]:
+        path = os.path.join(self.jobdir, name)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_options(self, options: dict):
+        seeds = options.get("seeds")
+        if seeds:
+            options = dict(options, seeds=[
+                {"url": s.url, "max_depth": s.max_depth, "max_pages": s.max_pages,
+                 "allow_subdomains": s.allow_subdomains} for s in seeds])
+        self._write("job.json", options)
+
+    def load_options(self) -> Optional[dict]:
+        options = self._read("job.json")
+        if options and options.get("seeds"):
+            options["seeds"] = [Seed(**s) for s in options["seeds"]]
+        return options
+
+    def due(self) -> bool:
+        return time.monotonic() - self.last >= self.interval
+
+    def _append_results(self, results: list):
+        path = os.path.join(self.jobdir, "results.jsonl")
+        with open(path, "wb" if self._offset is None else "r+b") as f:
+            f.seek(self._offset or 0)
+            for r in results:
+                f.write((json.dumps(result_to_dict(r), ensure_ascii=False) + "\n").encode("utf-8"))
+                self._matched[r.seed] += 1
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+            self._offset = f.tell()
+
+    def _read_results(self, size: int) -> list:
+        with open(os.path.join(self.jobdir, "results.jsonl"), "r+b") as f:
+            # Anything past `size` was appended after the last state.json
+            f.truncate(size)
+            return [result_from_dict(json.loads(line)) for line in f]
+
+    def save(self, crawler: "CrawlEngine", frontier: HostFrontier, pending):
+        """Snapshot the crawl. `pending` are dispatched pages that haven't finished;
+        they go back on the frontier with their page budget returned, and any
+        result one of them already recorded is held back until a later save
+        finds the page done, since the page is crawled again on resume."""
+        pending = list(pending)
+        redo = {item[0] for item in pending}
+        with crawler.lock:
+            fresh = self._held + crawler.results[self._taken:]
+            self._taken = len(crawler.results)
+            visited = visited_state(crawler.visited)
+            seeds = [{"pages_crawled": s.pages_crawled} for s in crawler.seeds]
+            pages_crawled = crawler.pages_crawled
+            stats = dict(crawler.stats)
+        self._held = [r for r in fresh if r.url in redo]
+        self._append_results([r for r in fresh if r.url not in redo])
+        for item in pending:
+            seeds[item[2]]["pages_crawled"] -= 1
+        for site, saved in zip(crawler.seeds, seeds):
+            saved["matched"] = self._matched[site.url]
+        stats.update(crawled=pages_crawled - len(pending), matched=sum(self._matched.values()))
+        frontier_file = None
+        if isinstance(frontier, DiskFrontier):
+            # A fresh name each time, so the file the last state.json names stays intact
+            frontier_file = f"frontier-{time.time_ns()}.sqlite"
+            frontier.backup(os.path.join(self.jobdir, frontier_file))
+            queued = pending + frontier.buffered()
+        else:
+            queued = pending + list(frontier)
+        self._write("state.json", {
+            "saved_at": datetime.now().isoformat(),
+            "frontier": queued,
+            "frontier_file": frontier_file,
+            "visited": visited,
+            "stats": stats,
+            "seeds": seeds,
+            "pages_crawled": pages_crawled - len(pending),
+            "results": {"file": "results.jsonl", "bytes": self._offset},
+            "sinks": {sink.path: sink.checkpoint_state() for sink in crawler.sinks
+                      if sink.checkpoint_state() is not None},
+        })
+        self._drop_frontier_file()
+        self._frontier_file = frontier_file
+        self.last = time.monotonic()
+
+    def _drop_frontier_file(self):
+        if self._frontier_file is not None:
+            try:
+                os.remove(os.path.join(self.jobdir, self._frontier_file))
+            except OSError:
+                pass
+
+    @staticmethod
+    def _queued_rows(path: str):
+        db = sqlite3.connect(path)
+        try:
+            yield from db.execute("SELECT url, depth, seed, score FROM frontier ORDER BY id")
+        finally:
+            db.close()
+
+    def restore(self, crawler: "CrawlEngine") -> Optional[Iterable]:
+        """Load the last snapshot into `crawler` and return its frontier items;
+        None if no checkpoint was taken yet, so the crawl starts from its seeds."""
+        state = self._read("state.json")
+        if state is None:
+            return None
+        crawler.visited = visited_from_state(state["visited"])
+        crawler.stats.update(state["stats"])
+        crawler.pages_crawled = state["pages_crawled"]
+        for site, saved in zip(crawler.seeds, state["seeds"]):
+            site.pages_crawled = saved["pages_crawled"]
+            site.matched       = saved["matched"]
+        results = state["results"]
+        if isinstance(results, list):   # a checkpoint from before results.jsonl
+            crawler.results = [result_from_dict(data) for data in results]
+            self._append_results(crawler.results)
+        else:
+            self._offset = results["bytes"]
+            crawler.results = self._read_results(self._offset)
+            self._matched = Counter(r.seed for r in crawler.results)
+        self._taken = len(crawler.results)
+        for sink in crawler.sinks:
+            if sink.path in state.get("sinks", {}):
+                sink.restore(state["sinks"][sink.path], crawler.results)
+        items = [tuple(item) for item in state["frontier"]]
+        self._frontier_file = state.get("frontier_file")
+        if self._frontier_file is None:
+            return items
+        return itertools.chain(items, self._queued_rows(os.path.join(self.jobdir, self._frontier_file)))
+
+# ─── Incremental Recrawl ─────────────────────────────────────────────────────
+PAGE_INDEX_FILE = ".page_index.sqlite"
+
+class PageIndex:
+    """What earlier crawls with the same keywords saw at each URL: a hash of the
+    body, when it was last seen, the PageResult it produced (if any) and its
+    in-scope links. A page whose body hash is unchanged reuses all of that
+    instead of being parsed again, and changes() reports how this run's
+    matches differ from the last one's. This run's rows are staged and only
+    replace the stored ones on commit(), once the crawl has finished."""
+
+    def __init__(self, path: str, keywords: list):
+        self.path = path
+        self.key  = ",".join(sorted(k.lower() for k in keywords))
+        self.lock = Lock()
+        self.db   = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        for table in ("pages", "staged"):
+            self.db.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                " keywords TEXT, url TEXT, digest TEXT, last_seen TEXT, result TEXT, links TEXT,"
+                " PRIMARY KEY (keywords, url))")
+        self.db.commit()
+        # Matches as of the last finished run
+        self.previous = {url: (digest, result) for url, digest, result in self.db.execute(
+            "SELECT url, digest, result FROM pages WHERE keywords = ? AND result IS NOT NULL",
+            (self.key,))}
+        self.current: dict = {}   # url -> digest, for pages seen in this run
+
+    def discard_staged(self):
+        """Drop rows an unfinished earlier run staged; this run starts afresh."""
+        with self.lock:
+            self.db.execute("DELETE FROM staged WHERE keywords = ?", (self.key,))
+            self.db.commit()
+
+    def resume(self):
+        """Carry on from the rows an interrupted run staged."""
+        with self.lock:
+            self.current = dict(self.db.execute(
+                "SELECT url, digest FROM staged WHERE keywords = ?", (self.key,)))
+
+    @staticmethod
+    def digest(html: str) -> str:
+        return hashlib.blake2b(html.encode("utf-8", "replace"), digest_size=16).hexdigest()
+
+    def lookup(self, url: str, digest: str) -> Optional[tuple]:
+        """(result dict or None, links or None) stored for an unchanged page, else None."""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT result, links FROM pages WHERE keywords = ? AND url = ? AND digest = ?",
+                (self.key, normalize_url(url), digest)).fetchone()
+        if row is None:
+            return None
+        result, links = row
+        return (json.loads(result) if result else None,
+                json.loads(links) if links is not None else None)
+
+    def remember(self, url: str, digest: str, result: Optional[PageResult],
+                 links: Optional[list]):
+        url = normalize_url(url)
+        with self.lock:
+            self.current[url] = digest
+            self.db.execute(
+                "INSERT OR REPLACE INTO staged VALUES (?, ?, ?, ?, ?, ?)",
+                (self.key, url, digest, datetime.now().isoformat(),
+                 json.dumps(result_to_dict(result), ensure_ascii=False) if result else None,
+                 json.dumps(links) if links is not None else None))
+            self.db.commit()
+
+    # What a match found on the page, as against when and from where it was crawled
+    _RUN_FIELDS = ("timestamp", "depth", "seed")
+
+    @classmethod
+    def _found(cls, data: dict) -> dict:
+        return {k: v for k, v in data.items() if k not in cls._RUN_FIELDS}
+
+    def changes(self, results: list) -> list:
+        """[(status, PageResult)] for matches that are new, changed or removed since
+        the last run. A match is changed when what was extracted differs, not
+        merely the page body (a new date in the footer changes the hash but not
+        the match). Only a page fetched this run can count as removed; one the
+        crawl didn't reach says nothing about whether it still matches."""
+        out, matched = [], set()
+        for r in results:
+            url = normalize_url(r.url)
+            matched.add(url)
+            previous = self.previous.get(url)
+            if previous is None:
+                out.append(("new", r))
+            elif previous[0] != self.current.get(url) and \
+                    self._found(json.loads(previous[1])) != self._found(result_to_dict(r)):
+                out.append(("changed", r))
+        for url, (_, result) in self.previous.items():
+            if url in self.current and url not in matched:
+                out.append(("removed", result_from_dict(json.loads(result))))
+        return out
+
+    def commit(self):
+        """Make this run's staged rows the ones the next run compares against.
+        A removed page's row has no result, so each removal is reported once."""
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO pages SELECT * FROM staged WHERE keywords = ?",
+                            (self.key,))
+            self.db.execute("DELETE FROM staged WHERE keywords = ?", (self.key,))
+            self.db.commit()
+
+# ─── Near-Duplicates ─────────────────────────────────────────────────────────
+# Page chrome repeated on every page of a site would make them all look alike
+_BOILERPLATE_RE = re.compile(r"<(script|style|head|nav|header|footer)\b.*?</\1\s*>",
+                             re.IGNORECASE | re.DOTALL)
+_TAG_RE  = re.compile(r"<[^>]*>")
+_WORD_RE = re.compile(r"\w+")
+# _LANES[k][b]: byte b as the k-th byte of a hash, with each of its bits moved into
+# its own 32-bit lane, so summing these over a page's features counts all 64 bit
+# positions in a handful of big-int additions instead of 64 per feature
+_LANES = [[sum(1 << (32 * (8 * k + j)) for j in range(8) if b >> j & 1) for b in range(256)]
+          for k in range(8)]
+_LANE_MASK = (1 << 32) - 1
+
+def simhash(html: str, shingle: int = 3, min_words: int = 20) -> Optional[int]:
+    """64-bit SimHash of a page's visible text over word `shingle`-grams; near-identical
+    texts get fingerprints a few bits apart. None for pages with too little text to
+    tell apart (empty frames, redirects), which should never count as duplicates."""
+    text = _TAG_RE.sub(" ", _BOILERPLATE_RE.sub(" ", html))
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < min_words:
+        return None
+    features = {" ".join(words[i:i + shingle]) for i in range(len(words) - shingle + 1)}
+    l0, l1, l2, l3, l4, l5, l6, l7 = _LANES
+    total = 0
+    for feature in features:
+        d = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        total += (l0[d[0]] + l1[d[1]] + l2[d[2]] + l3[d[3]]
+                  + l4[d[4]] + l5[d[5]] + l6[d[6]] + l7[d[7]])
+    half = len(features) / 2
+    return sum(1 << i for i in range(64) if (total >> (32 * i)) & _LANE_MASK > half)
+
+class SimHashIndex:
+    """Finds earlier fingerprints within `max_distance` bits of a new one. The 64 bits
+    are cut into max_distance + 1 bands; two fingerprints that close must agree on
+    at least one whole band, so only fingerprints sharing a band value are compared."""
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.width = 64 // self.bands
+        self.buckets = [defaultdict(list) for _ in range(self.bands)]
+        self.lock = Lock()
+
+    def _keys(self, fp: int):
+        mask = (1 << self.width) - 1
+        return [(fp >> (self.width * b)) & mask for b in range(self.bands)]
+
+    def add(self, fp: int) -> bool:
+        """Index `fp` unless an earlier fingerprint is near it; True if one was."""
+        keys = self._keys(fp)
+        with self.lock:
+            for bucket, key in zip(self.buckets, keys):
+                for other in bucket.get(key, ()):
+                    if bin(fp ^ other).count("1") <= self.max_distance:
+                        return True
+            for bucket, key in zip(self.buckets, keys):
+                bucket[key].append(fp)
+        return False
+
+# ─── Crawl Engine ────────────────────────────────────────────────────────────
+class CancelToken:
+    """Asks a running crawl to stop: no new pages are dispatched, in-flight ones
+    finish, and a --jobdir checkpoint keeps the rest of the frontier. Pass a
+    multiprocessing Event to cancel a crawl running in another process."""
+
+    def __init__(self, event=None):
+        self._event = event if event is not None else Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+class CrawlEngine:
+    """A crawl job: fetches on a thread pool (parsing in worker processes with
+    parse_procs), records matches, and reports through the on_* hooks and sinks.
+    Hooks are called from crawl threads, so front-ends must hand work over to
+    their own thread if they need to."""
+
+    def __init__(self, start_url: str, keyword: str, max_depth: int = 2,
+                 max_workers: int = 5, rate_limit: float = 0.3,
+                 allow_subdomains: bool = False, verbose: bool = False,
+                 timeout: int = 10, max_pages: int = 200,
+                 seeds: Optional[list] = None, parse_procs: int = 0,
+                 parse_batch_size: int = 16, cache_path: Optional[str] = None,
+                 jobdir: Optional[str] = None, checkpoint_every: float = 30.0,
+                 index_path: Optional[str] = None, dedup_distance: Optional[int] = None,
+                 visited: str = "set", visited_fp_rate: float = 0.001,
+                 frontier: str = "memory", strategy: str = "bfs", sinks: Optional[list] = None,
+                 on_result=None, on_log=None, on_progress=None,
+                 cancel: Optional[CancelToken] = None):
+        # A crawl job is one or more seeds; the single-URL form is a one-seed job
+        self.seeds           = seeds or [Seed(start_url, max_depth, max_pages, allow_subdomains)]
+        self.start_url       = self.seeds[0].url
+        self.keyword         = keyword  # original string (for display)
+        self.keywords        = split_keywords(keyword)
+        self.matcher         = KeywordMatcher(self.keywords)
+        self.max_depth       = max_depth
+        self.max_workers     = max_workers
+        self.rate_limit      = rate_limit
+        self.allow_subdomains = allow_subdomains
+        self.timeout         = timeout
+        self.max_pages       = max_pages
+        self.verbose         = verbose
+        self.parse_procs     = parse_procs
+        self.parse_batch_size = parse_batch_size
+
+        self.base_domain = self.seeds[0].base_domain
+
+        self.visited            = make_visited(visited, visited_fp_rate)
+        self.results: list      = []
+        self.lock               = Lock()
+        self.sink_lock          = Lock()    # serializes sink writes and flushes
+        self.limiter            = HostRateLimiter(rate_limit)
+        self.pages_crawled      = 0
+        self.logger             = setup_logger(verbose)
+        self.stats              = defaultdict(int)
+        seed_hosts              = {urlsplit(site.url).netloc for site in self.seeds}
+        self.session            = make_session(timeout, pool_size=max_workers,
+                                               hosts=max(32, len(seed_hosts)))
+        self.cache              = HttpCache(cache_path) if cache_path else None
+        self.checkpoint         = JobCheckpoint(jobdir, checkpoint_every) if jobdir else None
+        self.index              = PageIndex(index_path, self.keywords) if index_path else None
+        self.near_dupes         = SimHashIndex(dedup_distance) if dedup_distance is not None else None
+        self.frontier_kind      = frontier
+        self.best_first         = strategy == "best-first"
+        self.sinks: list        = list(sinks or [])
+        self.on_result          = on_result
+        self.on_log             = on_log
+        self.on_progress        = on_progress
+        self.cancel             = cancel or CancelToken()
+        self.page_budget        = sum(site.max_pages for site in self.seeds)
+        self._frontier          = None
+        self._resume_items: Optional[list] = None
+        self._rate_limited: dict = {}   # url -> times it was re-queued after a 429
+        self._spent: list       = []    # seeds whose budget ran out, still to drop from the frontier
+
+    def _already_visited(self, url: str) -> bool:
+        with self.lock:
+            if url in self.visited:
+                return True
+            self.visited.add(url)
+            return False
+
+    def _claim_page(self, seed: int) -> bool:
+        """Reserve one slot of the seed's max_pages budget; False once it is spent."""
+        with self.lock:
+            site = self.seeds[seed]
+            if site.pages_crawled >= site.max_pages:
+                return False
+            site.pages_crawled += 1
+            self.pages_crawled += 1
+            if site.pages_crawled >= site.max_pages:
+                self._spent.append(seed)
+            return True
+
+    def _log(self, message: str, kind: str = "info"):
+        """on_log hook; kind is "crawl", "info", "done" or "error"."""
+        if self.on_log:
+            self.on_log(message, kind)
+
+    def _count(self, *keys: str):
+        """Bump stats counters. Under the lock: a checkpoint copies the stats while
+        fetch threads add counters to them."""
+        with self.lock:
+            for key in keys:
+                self.stats[key] += 1
+
+    def _progress(self):
+        if self.on_progress:
+            with self.lock:
+                crawled, matched = self.stats["crawled"], self.stats["matched"]
+            self.on_progress(crawled, matched, self.page_budget)
+
+    def _stopping(self, frontier: HostFrontier) -> bool:
+        """True once nothing more should be dispatched: frontier empty or crawl cancelled."""
+        return not frontier or self.cancel.cancelled
+
+    def _next_item(self, frontier: HostFrontier) -> Optional[tuple]:
+        """Pop the next dispatchable item, reserving its page budget. Seeds whose
+        budget is spent are dropped first, so their items never take a host's token."""
+        with self.lock:
+            spent, self._spent = set(self._spent), []
+        if spent:
+            frontier.remove_if(lambda queued: queued[2] in spent)
+        while frontier and not self.cancel.cancelled:
+            item = frontier.pop(self.limiter.try_acquire)
+            if item is None or self._claim_page(item[2]):
+                return item
+            # That seed's budget is spent — drop the rest of its frontier
+            frontier.remove_if(lambda queued: queued[2] == item[2])
+        return None
+
+    def _requeue(self, frontier: HostFrontier, url: str, depth: int, seed: int,
+                 score: float = 0.0):
+        """Put a page that got a 429 back on the frontier, with its link score, and
+        return its page budget; after three 429s it counts as failed instead."""
+        with self.lock:
+            tries = self._rate_limited[url] = self._rate_limited.get(url, 0) + 1
+            if tries < 3:
+                self.seeds[seed].pages_crawled -= 1
+                self.pages_crawled -= 1
+        if tries < 3:
+            frontier.push(url, depth, seed, score)
+            return
+        self._count("crawled", "failed")
+        self._progress()
+
+    def _enqueue_links(self, frontier: HostFrontier, links: list, depth: int, seed: int):
+        site = self.seeds[seed]
+        if depth >= site.max_depth or site.pages_crawled >= site.max_pages:
+            return
+        for link in links:
+            # Best-first links arrive as (link, score) pairs
+            link, score = (link, 0.0) if isinstance(link, str) else link
+            if not self._already_visited(link):
+                frontier.push(link, depth + 1, seed, score)
+
+    def restore_checkpoint(self):
+        """Continue from the job directory's last checkpoint instead of the seeds."""
+        self._resume_items = self.checkpoint.restore(self)
+        if self.index and self._resume_items is not None:
+            self.index.resume()
+        # Fresh output files start with what the earlier run had found
+        for result in self.results:
+            for sink in self.sinks:
+                if not sink.accumulates:
+                    sink.write(result)
+
+    def _save_checkpoint(self, frontier: HostFrontier, pending, force: bool = False):
+        if self.checkpoint and (force or self.checkpoint.due()):
+            self.checkpoint.save(self, frontier, pending)
+
+    def _seed_frontier(self) -> HostFrontier:
+        frontier = self._frontier = make_frontier(
+            self.frontier_kind, "best-first" if self.best_first else "bfs")
+        if self._resume_items is not None:
+            for item in self._resume_items:
+                frontier.push(*item)
+            return frontier
+        if self.index:
+            self.index.discard_staged()
+        for i, site in enumerate(self.seeds):
+            if not self._already_visited(normalize_url(site.url)):
+                frontier.push(site.url, 0, i)
+        return frontier
+
+    def _dispatch_delay(self, frontier: HostFrontier) -> float:
+        """How long until some host in the frontier may be fetched again."""
+        return min((self.limiter.wait_time(h) for h in frontier.hosts()), default=0.0)
+
+    def _wait_timeout(self, frontier: HostFrontier, can_dispatch: bool) -> Optional[float]:
+        """Scheduler tick: flush the sinks that are due, then return how long to wait
+        for in-flight work — until a host's next token (only if there is a free slot
+        to use it), the next sink flush or the next checkpoint; None to just block."""
+        timeouts = []
+        if can_dispatch and not self._stopping(frontier):
+            timeouts.append(self._dispatch_delay(frontier))
+        with self.sink_lock:
+            for sink in self.sinks:
+                sink.flush()
+                due = sink.flush_due()
+                if due is not None:
+                    timeouts.append(due)
+        if self.checkpoint:
+            timeouts.append(self.checkpoint.interval)
+        return min(timeouts, default=None)
+
+    def _fetch_html(self, url: str, depth: int, seed: int = 0) -> Optional[str]:
+        """I/O half of a crawl step: the decoded page, or None if it is not usable HTML."""
+        self._log(f"[{depth}/{self.seeds[seed].max_depth}]: {url}", "crawl")
+        self.logger.debug(f"Crawling depth={depth}: {url}")
+
+        resp = fetch_page(self.session, url, self.timeout, logger=self.logger,
+                          limiter=self.limiter, cache=self.cache)
+        if resp is None:
+            self._count("crawled", "failed")
+            self._progress()
+            return None
+
+        self._count("crawled")
+        content_type = resp.headers.get("Content-Type", "")
+        if "text/html" not in content_type:
+            return None
+
+        return resp.text
+
+    def _crawl_page(self, url: str, depth: int, seed: int = 0):
+        html = self._fetch_html(url, depth, seed)
+        if html is None:
+            return []
+        return self._process_page(url, depth, html, seed)
+
+    def _process_page(self, url: str, depth: int, html: str, seed: int = 0) -> list:
+        """CPU-bound half of a crawl step: extract a match (if any) and in-scope links."""
+        if self.near_dupes is not None and self._is_near_duplicate(url, simhash(html)):
+            return []
+        outcome, digest = self._reuse_page(url, depth, html, seed)
+        if outcome is None:
+            outcome = analyze_page(html, url, depth, self.matcher, self.seeds[seed], self.best_first)
+        self._remember_page(url, digest, outcome)
+        result, links, prefiltered = outcome
+        self._record_page(result, prefiltered, seed)
+        return links
+
+    def _is_near_duplicate(self, url: str, fp: Optional[int]) -> bool:
+        """True for a page whose simhash `fp` nearly matches one crawled earlier; it
+        is neither extracted nor expanded."""
+        if fp is None or not self.near_dupes.add(fp):
+            return False
+        self._count("duplicates")
+        self.logger.debug(f"Near-duplicate skipped: {url}")
+        return True
+
+    def _reuse_page(self, url: str, depth: int, html: str, seed: int) -> tuple:
+        """(outcome, body digest) — outcome being analyze_page's tuple rebuilt from the
+        page index when the body is unchanged since the last run, else None."""
+        if self.index is None:
+            return None, None
+        digest = self.index.digest(html)
+        stored = self.index.lookup(url, digest)
+        if stored is None:
+            return None, digest
+        data, links = stored
+        site = self.seeds[seed]
+        # Stamped like a freshly parsed match, and a page the pre-filter would have
+        # skipped still counts as prefiltered; could_match is as cheap as skipping it
+        result, prefiltered = None, not data and not self.matcher.could_match(html)
+        if data:
+            result = result_from_dict(dict(data, depth=depth, seed=site.url,
+                                           timestamp=datetime.now().isoformat()))
+        if depth >= site.max_depth:
+            links = []
+        elif links is None:
+            links = extract_links(html, url, site.base_domain, site.allow_subdomains,
+                                  anchors=self.best_first)
+            if self.best_first:
+                links = score_links(links, self.matcher)
+        self._count("unchanged")
+        return (result, links, prefiltered), digest
+
+    def _remember_page(self, url: str, digest: Optional[str], outcome: tuple):
+        if digest is not None:
+            result, links, _ = outcome
+            self.index.remember(url, digest, result, links or None)
+
+    def _record_page(self, result: Optional[PageResult], prefiltered: bool, seed: int):
+        if prefiltered:
+            self._count("prefiltered")
+        if result is not None:
+            with self.lock:
+                self.results.append(result)
+                self.seeds[seed].matched += 1
+                self.stats["matched"] += 1
+            # Sink I/O has its own lock, so a flush never holds up the workers' bookkeeping
+            with self.sink_lock:
+                for sink in self.sinks:
+                    sink.write(result)
+            if self.on_result:
+                self.on_result(result)
+        self._progress()
+
+    def run(self):
+        target = f"{len(self.seeds)} sites" if len(self.seeds) > 1 else self.start_url
+        self._log(f"Crawl started → {target}")
+        self._log(f"Keywords: {' · '.join(self.keywords)}")
+        try:
+            self._run()
+        finally:
+            self._close_frontier()
+        self._log(f"{'Stopped' if self.cancel.cancelled else 'Complete'} — "
+                  f"Crawled: {self.stats['crawled']}  Matched: {self.stats['matched']}  "
+                  f"Pre-filtered: {self.stats['prefiltered']}  Failed: {self.stats['failed']}"
+                  + (f"  From cache: {self.cache.hits}" if self.cache else ""), "done")
+
+    def _run(self):
+        if self.parse_procs > 0:
+            self._run_pipeline()
+        else:
+            self._run_threads()
+
+    def _close_frontier(self):
+        if self._frontier is not None:
+            self._frontier.close()
+            self._frontier = None
+
+    def _run_threads(self):
+        # BFS with a persistent thread pool: the frontier is fed continuously,
+        # so a slow page only occupies its own worker instead of stalling a batch.
+        # Items are only dispatched once their host's token bucket allows it.
+        frontier = self._seed_frontier()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+
+            def fill():
+                # Only as many as there are workers: a page waiting in the executor's
+                # queue would already hold its host's token and fire late, in a burst
+                while frontier and len(futures) < self.max_workers:
+                    item = self._next_item(frontier)
+                    if item is None:
+                        break
+                    futures[executor.submit(self._crawl_page, *item[:3])] = item
+
+            try:
+                while True:
+                    fill()
+                    if not futures:
+                        if self._stopping(frontier):
+                            break
+                        time.sleep(self._wait_timeout(frontier, True))
+                        continue
+                    timeout = self._wait_timeout(frontier, len(futures) < self.max_workers)
+                    done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        url, depth, seed, score = futures.pop(future)
+                        try:
+                            self._enqueue_links(frontier, future.result(), depth, seed)
+                        except RateLimited:
+                            self._requeue(frontier, url, depth, seed, score)
+                        except Exception as e:
+                            self.logger.error(f"Error processing {url}: {e}")
+                    self._save_checkpoint(frontier, futures.values())
+            except KeyboardInterrupt:
+                # Drop queued pages so Ctrl-C only waits for in-flight requests
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._save_checkpoint(frontier, futures.values(), force=True)
+                raise
+        self._save_checkpoint(frontier, (), force=True)
+
+    def _run_pipeline(self):
+        """Fetch on threads, parse in `parse_procs` worker processes so extraction
+        is not bound to one core by the GIL. Fetched pages are shipped to the pool
+        in batches of up to `parse_batch_size` to amortize pickling; a partial
+        batch goes out after 0.25 s, or at once when no fetch is in flight."""
+        frontier = self._seed_frontier()
+        keywords = tuple(self.keywords)
+        batch, batch_started = [], 0.0
+        flush_after = 0.25
+        digests = {}   # url -> body digest of pages out for parsing, for the page index
+        reused  = {}   # url -> outcome from the page index, for pages out only to be fingerprinted
+        fingerprint = self.near_dupes is not None
+
+        # spawn, not fork: forking a process that already runs fetch threads can
+        # copy locks held by those threads into the children
+        context = multiprocessing.get_context("spawn")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as fetchers, \
+             ProcessPoolExecutor(max_workers=self.parse_procs, mp_context=context) as parsers:
+            fetches, parses = {}, {}
+
+            def flush():
+                nonlocal batch
+                jobs = [(url, depth, html, self.seeds[seed], url not in reused)
+                        for url, depth, seed, _, html in batch]
+                future = parsers.submit(parse_batch, keywords, jobs, self.best_first, fingerprint)
+                parses[future] = [item[:4] for item in batch]
+                batch = []
+
+            def pending():
+                yield from fetches.values()
+                yield from (item[:4] for item in batch)
+                for pages in parses.values():
+                    yield from pages
+
+            try:
+                while True:
+                    # Stop fetching ahead while the parsers are backed up
+                    while (frontier and len(fetches) < self.max_workers
+                           and len(parses) < self.parse_procs * 2):
+                        item = self._next_item(frontier)
+                        if item is None:
+                            break
+                        fetches[fetchers.submit(self._fetch_html, *item[:3])] = item
+                    if batch and (len(batch) >= self.parse_batch_size or not fetches
+                                  or time.monotonic() - batch_started >= flush_after):
+                        flush()
+                    if not fetches and not parses:
+                        if self._stopping(frontier):
+                            break
+                        time.sleep(self._wait_timeout(frontier, True))
+                        continue
+
+                    timeout = self._wait_timeout(frontier, len(fetches) < self.max_workers
+                                                 and len(parses) < self.parse_procs * 2)
+                    if batch:
+                        batch_due = max(0.0, batch_started + flush_after - time.monotonic())
+                        timeout = batch_due if timeout is None else min(timeout, batch_due)
+                    done, _ = wait(list(fetches) + list(parses), timeout=timeout,
+                                   return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future in fetches:
+                            url, depth, seed, score = fetches.pop(future)
+                            try:
+                                html = future.result()
+                            except RateLimited:
+                                self._requeue(frontier, url, depth, seed, score)
+                                continue
+                            except Exception as e:
+                                self.logger.error(f"Error processing {url}: {e}")
+                                continue
+                            if html is None:
+                                continue
+                            outcome, digest = self._reuse_page(url, depth, html, seed)
+                            if outcome is not None:
+                                if not fingerprint:
+                                    # Unchanged since the last run — no need to ship it out
+                                    self._remember_page(url, digest, outcome)
+                                    result, links, prefiltered = outcome
+                                    self._record_page(result, prefiltered, seed)
+                                    self._enqueue_links(frontier, links, depth, seed)
+                                    continue
+                                reused[url] = outcome
+                            if digest is not None:
+                                digests[url] = digest
+                            if not batch:
+                                batch_started = time.monotonic()
+                            batch.append((url, depth, seed, score, html))
+                        else:
+                            pages = parses.pop(future)
+                            try:
+                                outcomes = future.result()
+                            except Exception as e:
+                                self.logger.error(f"Error parsing a batch of {len(pages)} pages: {e}")
+                                continue
+                            finally:
+                                kept = [(digests.pop(url, None), reused.pop(url, None))
+                                        for url, *_ in pages]
+                            for (url, depth, seed, _), (fp, outcome), (digest, stored) in \
+                                    zip(pages, outcomes, kept):
+                                outcome = outcome or stored
+                                if fingerprint and self._is_near_duplicate(url, fp):
+                                    continue
+                                self._remember_page(url, digest, outcome)
+                                result, links, prefiltered = outcome
+                                self._record_page(result, prefiltered, seed)
+                                self._enqueue_links(frontier, links, depth, seed)
+                    self._save_checkpoint(frontier, pending())
+            except KeyboardInterrupt:
+                fetchers.shutdown(wait=False, cancel_futures=True)
+                parsers.shutdown(wait=False, cancel_futures=True)
+                self._save_checkpoint(frontier, pending(), force=True)
+                raise
+        self._save_checkpoint(frontier, (), force=True)
+
+class _ParseBatcher:
+    """Gathers the async engine's parse_batch jobs into batches of up to `size` for
+    the process pool, as _run_pipeline does. A partial batch goes out after
+    `delay` seconds, or at once when every page in flight is waiting on a parse."""
+
+    def __init__(self, pool, keywords: tuple, score: bool, fingerprint: bool,
+                 size: int, in_flight, delay: float = 0.25):
+        self.pool        = pool
+        self.args        = (keywords, score, fingerprint)
+        self.size        = size
+        self.in_flight   = in_flight      # () -> pages the crawl has in flight
+        self.delay       = delay
+        self._jobs: list = []
+        self._waiters: list = []
+        self._shipped    = 0              # pages in batches that haven't come back
+        self._timer      = None
+
+    async def parse(self, job: tuple) -> tuple:
+        """parse_batch's (fingerprint, outcome) for one (url, depth, html, site, analyze) job."""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._jobs.append(job)
+        self._waiters.append(waiter)
+        if len(self._jobs) >= self.size or len(self._jobs) + self._shipped >= self.in_flight():
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.delay, self._flush)
+        return await waiter
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        jobs, waiters = self._jobs, self._waiters
+        self._jobs, self._waiters = [], []
+        if not jobs:
+            return
+        keywords, score, fingerprint = self.args
+        self._shipped += len(jobs)
+        future = asyncio.get_running_loop().run_in_executor(
+            self.pool, parse_batch, keywords, jobs, score, fingerprint)
+        future.add_done_callback(lambda done: self._deliver(done, waiters))
+
+    def _deliver(self, done, waiters: list):
+        self._shipped -= len(waiters)
+        error = None if done.cancelled() else done.exception()
+        for i, waiter in enumerate(waiters):
+            if waiter.done():
+                continue                  # its crawl task was cancelled
+            if done.cancelled():
+                waiter.cancel()
+            elif error is not None:
+                waiter.set_exception(error)
+            else:
+                waiter.set_result(done.result()[i])
+
+class AsyncCrawlEngine(CrawlEngine):
+    """CrawlEngine that fetches with aiohttp, keeping up to `concurrency` requests in
+    flight on one event loop. Parsing is handed to a pool of `max_workers` threads
+    (or batched out to `parse_procs` processes) so the loop never blocks; results
+    and hooks are the same as CrawlEngine's."""
+
+    def __init__(self, *args, concurrency: int = 100, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.concurrency = concurrency
+
+    async def _crawl_page_async(self, session, parser, url: str, depth: int,
+                                seed: int = 0) -> list:
+        """One crawl step; `parser` is the parse thread pool, or a _ParseBatcher
+        with parse_procs."""
+        self._log(f"[{depth}/{self.seeds[seed].max_depth}]: {url}", "crawl")
+        self.logger.debug(f"Crawling depth={depth}: {url}")
+
+        page = await fetch_page_async(session, url, logger=self.logger, limiter=self.limiter,
+                                      cache=self.cache)
+        if page is None:
+            self._count("crawled", "failed")
+            self._progress()
+            return []
+
+        self._count("crawled")
+        content_type, html = page
+        if "text/html" not in content_type:
+            return []
+
+        if not self.parse_procs:
+            return await asyncio.get_running_loop().run_in_executor(
+                parser, self._process_page, url, depth, html, seed)
+        # Worker processes can't touch crawler state; record the outcome here
+        outcome, digest = self._reuse_page(url, depth, html, seed)
+        fingerprint = self.near_dupes is not None
+        if outcome is None or fingerprint:
+            fp, parsed = await parser.parse((url, depth, html, self.seeds[seed], outcome is None))
+            if fingerprint and self._is_near_duplicate(url, fp):
+                return []
+            outcome = outcome or parsed
+        self._remember_page(url, digest, outcome)
+        result, links, prefiltered = outcome
+        self._record_page(result, prefiltered, seed)
+        return links
+
+    async def _run_async(self):
+        frontier = self._seed_frontier()
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ssl=False)
+        timeout   = aiohttp.ClientTimeout(total=self.timeout)
+        headers   = dict(self.session.headers)
+
+        if self.parse_procs:
+            parse_pool = ProcessPoolExecutor(max_workers=self.parse_procs,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        else:
+            parse_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        tasks = {}
+        parser = parse_pool
+        if self.parse_procs:
+            parser = _ParseBatcher(parse_pool, tuple(self.keywords), self.best_first,
+                                   self.near_dupes is not None, self.parse_batch_size,
+                                   lambda: len(tasks))
+        with parse_pool:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                             headers=headers) as session:
+                try:
+                    while True:
+                        while frontier and len(tasks) < self.concurrency:
+                            item = self._next_item(frontier)
+                            if item is None:
+                                break
+                            task = asyncio.create_task(
+                                self._crawl_page_async(session, parser, *item[:3]))
+                            tasks[task] = item
+                        if not tasks:
+                            if self._stopping(frontier):
+                                break
+                            await asyncio.sleep(self._wait_timeout(frontier, True))
+                            continue
+                        timeout = self._wait_timeout(frontier, len(tasks) < self.concurrency)
+                        done, _ = await asyncio.wait(tasks, timeout=timeout,
+                                                     return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            url, depth, seed, score = tasks.pop(task)
+                            try:
+                                self._enqueue_links(frontier, task.result(), depth, seed)
+                            except RateLimited:
+                                self._requeue(frontier, url, depth, seed, score)
+                            except Exception as e:
+                                self.logger.error(f"Error processing {url}: {e}")
+                        self._save_checkpoint(frontier, tasks.values())
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    # Also reached on Ctrl-C, when asyncio.run cancels this coroutine
+                    self._save_checkpoint(frontier, tasks.values(), force=True)
+
+    def _run(self):
+        if aiohttp is None:
+            raise RuntimeError("the async engine needs aiohttp — pip install aiohttp")
+        asyncio.run(self._run_async())
+
+ENGINES = ("threads", "async")
+
+def make_engine(engine: str = "threads", concurrency: int = 100, **options) -> CrawlEngine:
+    """CrawlEngine for `engine` "threads", or AsyncCrawlEngine for "async"."""
+    if engine == "async":
+        return AsyncCrawlEngine(concurrency=concurrency, **options)
+    return CrawlEngine(**options)
+
+# ─── Background Crawls ───────────────────────────────────────────────────────
+def crawl_to_queue(options: dict, events, cancel: CancelToken):
+    """Run a CrawlEngine whose hooks post (kind, ...) events to `events`, ending
+    with ("done", crawled, matched). CrawlRunner's thread or process target."""
+    def on_result(r):
+        events.put(("result", r))
+        kws = ", ".join(getattr(r, "matched_keywords", []))
+        events.put(("log", f"● MATCH  {r.page_title or r.url}  [{kws}]  ×{r.keyword_count}", "match"))
+
+    engine = None
+    try:
+        engine = CrawlEngine(
+            **options, cancel=cancel, on_result=on_result,
+            on_log=lambda m, kind: events.put(("log", m, kind)),
+            on_progress=lambda c, m, t: events.put(("progress", c, m, t)))
+        engine.run()
+    except Exception as e:
+        events.put(("log", f"Crawl failed: {e}", "error"))
+    stats = engine.stats if engine else {}
+    events.put(("done", stats.get("crawled", 0), stats.get("matched", 0)))
+
+class CrawlRunner:
+    """A crawl running in the background of a UI, on a thread or, with `process`,
+    in a spawned process so its parsing doesn't compete with the UI for the GIL.
+    The UI polls drain() on a timer, stop()s the crawl and, if a process hasn't
+    wound down some time after that, kill()s it."""
+
+    def __init__(self, options: dict, process: bool = False):
+        if process:
+            context = multiprocessing.get_context("spawn")
+            self.events = context.Queue()
+            self.cancel = CancelToken(context.Event())
+            self.worker = context.Process(target=crawl_to_queue, daemon=True,
+                                          args=(options, self.events, self.cancel))
+        else:
+            self.events = queue.SimpleQueue()
+            self.cancel = CancelToken()
+            self.worker = threading.Thread(target=crawl_to_queue, daemon=True,
+                                           args=(options, self.events, self.cancel))
+        self.process  = process
+        self.finished = False
+        self._stats   = (0, 0)     # (crawled, matched) as of the last progress event
+
+    def start(self):
+        if not self.process:
+            self.worker.start()
+            return
+        # spawn re-runs the parent's main script in the child before calling the
+        # target; for a GUI that would import Tk there, so it is hidden meanwhile
+        main = sys.modules["__main__"]
+        sys.modules["__main__"] = types.ModuleType("__main__")
+        try:
+            self.worker.start()
+        finally:
+            sys.modules["__main__"] = main
+
+    def stop(self):
+        self.cancel.cancel()
+
+    def kill(self) -> bool:
+        """Terminate a crawl process that is still running; True if it was."""
+        if not self.process or not self.worker.is_alive():
+            return False
+        self.worker.terminate()
+        self.worker.join()
+        return True
+
+    def pending(self) -> bool:
+        """True while there are events drain() hasn't returned yet."""
+        return not self.events.empty()
+
+    def drain(self, limit: int = 20000) -> tuple:
+        """Up to `limit` events posted since the last call, folded into (log lines,
+        results, latest progress or None, (crawled, matched) or None). The last
+        is set once the crawl has ended, including a process that died or was
+        killed without posting "done"; it then has the last progress counts."""
+        lines, results, progress, done = [], [], None, None
+        for _ in range(limit):
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == "log":
+                lines.append(event[1:])
+            elif kind == "result":
+                results.append(event[1])
+            elif kind == "progress":
+                progress = event[1:]
+                self._stats = progress[:2]
+            else:
+                done = event[1:]
+        if (done is None and not self.finished and self.process
+                and not self.worker.is_alive() and self.events.empty()):
+            self.worker.join()
+            done = self._stats
+        if done is not None:
+            self.finished = True
+        return lines, results, progress, done
+
+# ─── Output Saving ────────────────────────────────────────────────────────────
+CSV_HEADER = [
+    "URL", "Page Title", "Keyword Hits", "Names", "Emails",
+    "Phones", "Departments", "Top Snippet", "Depth", "Timestamp", "Seed"
+]
+
+def _csv_row(r: PageResult) -> list:
+    return [
+        r.url,
+        r.page_title,
+        r.keyword_count,
+        " | ".join(r.names),
+        " | ".join(r.emails),
+        " | ".join(r.phones),
+        " | ".join(r.departments),
+        r.matched_snippets[0][:300] if r.matched_snippets else "",
+        r.depth,
+        r.timestamp,
+        r.seed,
+    ]
+
+def save_changes_csv(changes: list, filename: str):
+    """PageIndex.changes() output: the usual columns behind a new/changed/removed one."""
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Change"] + CSV_HEADER)
+        for status, r in changes:
+            writer.writerow([status] + _csv_row(r))
+
+# ─── Streaming Sinks ─────────────────────────────────────────────────────────
+class ResultSink:
+    """Receives every PageResult as the crawler records it, so results reach disk
+    during the crawl rather than after it. Writes are serialized by the crawler.
+    The file is opened on the first result (a crawl with no matches leaves none
+    behind) and flushed at most every `flush_every` seconds; close() flushes the rest."""
+
+    accumulates = False     # keeps earlier runs' rows, so a resumed crawl mustn't replay them
+
+    def __init__(self, path: str, flush_every: float = 1.0):
+        self.path = path
+        self.flush_every = flush_every
+        self.written = 0
+        self._file = None
+        self._flushed = 0.0
+        self._dirty = False
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _write(self, result: PageResult):
+        raise NotImplementedError
+
+    def write(self, result: PageResult):
+        if self._file is None:
+            self._open()
+        self._write(result)
+        self.written += 1
+        self._dirty = True
+        self.flush()
+
+    def flush(self):
+        """Flush what was written since the last flush, if `flush_every` has passed."""
+        now = time.monotonic()
+        if self._dirty and now - self._flushed >= self.flush_every:
+            self._flush()
+            self._flushed = now
+            self._dirty = False
+
+    def flush_due(self) -> Optional[float]:
+        """Seconds until flush() would write something; None if nothing is waiting."""
+        if not self._dirty:
+            return None
+        return max(0.0, self._flushed + self.flush_every - time.monotonic())
+
+    def _flush(self):
+        self._file.flush()
+
+    def checkpoint_state(self) -> Optional[dict]:
+        """What a --jobdir checkpoint must keep for restore() to carry on this
+        sink's output on resume; None if there is nothing to keep."""
+        return None
+
+    def restore(self, state: dict, results: list):
+        """Carry on from `state` when resuming a checkpoint that counts `results`."""
+        pass
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class CsvSink(ResultSink):
+    """CSV_HEADER columns, a row per result."""
+
+    def _open(self):
+        self._file = open(self.path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSV_HEADER)
+
+    def _write(self, result: PageResult):
+        self._writer.writerow(_csv_row(result))
+
+class JsonlSink(ResultSink):
+    """JSON Lines, one result_to_dict() object per line; gzip-compressed when the
+    path ends in .gz. A gzip flush ends a deflate block, so the file stays readable
+    up to the last flush if the crawl dies."""
+
+    def _open(self):
+        if self.path.endswith(".gz"):
+            self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        else:
+            self._file = open(self.path, "w", encoding="utf-8")
+
+    def _write(self, result: PageResult):
+        self._file.write(json.dumps(result_to_dict(result), ensure_ascii=False) + "\n")
+
+RESULT_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawls (
+    id INTEGER PRIMARY KEY, keywords TEXT, started TEXT);
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY, crawl_id INTEGER REFERENCES crawls(id), url TEXT, domain TEXT,
+    seed TEXT, title TEXT, depth INTEGER, keyword_count INTEGER, snippet TEXT, timestamp TEXT);
+CREATE TABLE IF NOT EXISTS people      (page_id INTEGER REFERENCES pages(id), name TEXT);
+CREATE TABLE IF NOT EXISTS emails      (page_id INTEGER REFERENCES pages(id), email TEXT, domain TEXT);
+CREATE TABLE IF NOT EXISTS phones      (page_id INTEGER REFERENCES pages(id), phone TEXT);
+CREATE TABLE IF NOT EXISTS departments (page_id INTEGER REFERENCES pages(id), department TEXT);
+CREATE TABLE IF NOT EXISTS keyword_hits (page_id INTEGER REFERENCES pages(id), keyword TEXT);
+CREATE INDEX IF NOT EXISTS pages_url      ON pages (url);
+CREATE INDEX IF NOT EXISTS pages_domain   ON pages (domain);
+CREATE INDEX IF NOT EXISTS people_page    ON people (page_id);
+CREATE INDEX IF NOT EXISTS people_name    ON people (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS emails_email   ON emails (email);
+CREATE INDEX IF NOT EXISTS emails_domain  ON emails (domain);
+CREATE INDEX IF NOT EXISTS emails_page    ON emails (page_id);
+CREATE INDEX IF NOT EXISTS phones_page    ON phones (page_id);
+CREATE INDEX IF NOT EXISTS depts_page     ON departments (page_id);
+CREATE INDEX IF NOT EXISTS hits_keyword   ON keyword_hits (keyword, page_id);
+CREATE INDEX IF NOT EXISTS hits_page      ON keyword_hits (page_id);
+"""
+
+class SqliteSink(ResultSink):
+    """Normalized SQLite store that accumulates across crawls: each run adds a row
+    to `crawls`, each match a row to `pages`, and its names, emails, phones,
+    departments and matched keywords go to child tables keyed by page_id. Results
+    are queued and inserted in one transaction per flush (or per `batch` rows).
+    A resumed crawl carries on its own `crawls` row, first dropping rows of pages
+    the checkpoint doesn't count as done, since those are crawled again.
+    For example, every contact on pages mentioning a keyword, across all crawls:
+
+        SELECT DISTINCT e.email, p.url FROM keyword_hits k
+        JOIN pages p ON p.id = k.page_id JOIN emails e ON e.page_id = p.id
+        WHERE k.keyword = 'machine learning'
+    """
+
+    accumulates = True
+
+    def __init__(self, path: str, keyword: str = "", flush_every: float = 1.0, batch: int = 500):
+        super().__init__(path, flush_every)
+        self.keyword = keyword
+        self.batch = batch
+        self.started = datetime.now().isoformat()
+        self._resumed = False
+        self._pending: list = []
+
+    def _open(self):
+        self._file = sqlite3.connect(self.path, check_same_thread=False)
+        self._file.execute("PRAGMA journal_mode=WAL")
+        self._file.execute("PRAGMA synchronous=NORMAL")
+        self._file.executescript(RESULT_DB_SCHEMA)
+        row = None
+        if self._resumed:
+            row = self._file.execute("SELECT id FROM crawls WHERE keywords = ? AND started = ?",
+                                     (self.keyword, self.started)).fetchone()
+        if row is not None:
+            self.crawl_id = row[0]
+            return
+        with self._file:
+            self.crawl_id = self._file.execute(
+                "INSERT INTO crawls (keywords, started) VALUES (?, ?)",
+                (self.keyword, self.started)).lastrowid
+
+    def checkpoint_state(self) -> Optional[dict]:
+        # The crawls row is found again by its start time, even if it was only
+        # created after the checkpoint
+        return {"started": self.started}
+
+    def restore(self, state: dict, results: list):
+        self.started = state["started"]
+        self._resumed = True
+        self._open()
+        done = {r.url for r in results}
+        with self._file:
+            cur = self._file.cursor()
+            ids = [(page_id,) for page_id, url in cur.execute(
+                "SELECT id, url FROM pages WHERE crawl_id = ?", (self.crawl_id,)) if url not in done]
+            for table in ("people", "emails", "phones", "departments", "keyword_hits"):
+                cur.executemany(f"DELETE FROM {table} WHERE page_id = ?", ids)
+            cur.executemany("DELETE FROM pages WHERE id = ?", ids)
+
+    def _write(self, result: PageResult):
+        self._pending.append(result)
+        if len(self._pending) >= self.batch:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        with self._file:
+            cur = self._file.cursor()
+            for r in self._pending:
+                page_id = cur.execute(
+                    "INSERT INTO pages (crawl_id, url, domain, seed, title, depth, keyword_count,"
+                    " snippet, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (self.crawl_id, r.url, urlsplit(r.url).netloc.lower(), r.seed, r.page_title,
+                     r.depth, r.keyword_count, r.matched_snippets[0] if r.matched_snippets else "",
+                     r.timestamp)).lastrowid
+                cur.executemany("INSERT INTO people VALUES (?, ?)",
+                                [(page_id, name) for name in r.names])
+                cur.executemany("INSERT INTO emails VALUES (?, ?, ?)",
+                                [(page_id, e.lower(), e.rpartition("@")[2].lower()) for e in r.emails])
+                cur.executemany("INSERT INTO phones VALUES (?, ?)",
+                                [(page_id, phone) for phone in r.phones])
+                cur.executemany("INSERT INTO departments VALUES (?, ?)",
+                                [(page_id, dept) for dept in r.departments])
+                cur.executemany("INSERT INTO keyword_hits VALUES (?, ?)",
+                                [(page_id, kw.lower()) for kw in getattr(r, "matched_keywords", [])])
+        self._pending.clear()
+
+    def close(self):
+        if self._file is not None:
+            self._flush()
+        super().close()
+
+class ColumnarSink(ResultSink):
+    """Parquet file (Arrow IPC for .arrow / .feather) with one column per PageResult
+    field: names, emails, phones, departments, snippets and matched keywords as
+    list<string> columns, timestamp as a real timestamp. Rows are buffered and
+    written `row_group` at a time, so memory stays bounded; the file is only
+    readable once close() has written its footer. Needs pyarrow."""
+
+    def __init__(self, path: str, row_group: int = 10_000):
+        super().__init__(path, flush_every=float("inf"))
+        try:
+            import pyarrow
+        except ImportError:
+            raise RuntimeError("Parquet/Arrow output needs pyarrow — pip install pyarrow")
+        self._pa = pyarrow
+        self.row_group = row_group
+        self.parquet = not path.lower().endswith((".arrow", ".feather"))
+        self._columns = self._empty_columns()
+
+    @staticmethod
+    def _empty_columns() -> dict:
+        return {name: [] for name in (
+            "url", "page_title", "keyword_count", "names", "emails", "phones", "departments",
+            "matched_snippets", "matched_keywords", "depth", "timestamp", "seed")}
+
+    def _open(self):
+        pa = self._pa
+        strings = pa.list_(pa.string())
+        self.schema = pa.schema([
+            ("url", pa.string()), ("page_title", pa.string()), ("keyword_count", pa.int32()),
+            ("names", strings), ("emails", strings), ("phones", strings), ("departments", strings),
+            ("matched_snippets", strings), ("matched_keywords", strings),
+            ("depth", pa.int16()), ("timestamp", pa.timestamp("us")), ("seed", pa.string()),
+        ])
+        if self.parquet:
+            import pyarrow.parquet as pq
+            self._file = pq.ParquetWriter(self.path, self.schema, compression="zstd")
+        else:
+            self._file = pa.ipc.new_file(self.path, self.schema)
+
+    def _write(self, result: PageResult):
+        columns = self._columns
+        for name, value in result_to_dict(result).items():
+            if name in columns:
+                columns[name].append(value)
+        if len(columns["url"]) >= self.row_group:
+            self._write_group()
+
+    def _write_group(self):
+        columns, self._columns = self._columns, self._empty_columns()
+        columns["timestamp"] = [datetime.fromisoformat(t) for t in columns["timestamp"]]
+        self._file.write_table(self._pa.Table.from_pydict(columns, schema=self.schema))
+
+    def _flush(self):
+        pass    # a row group is written when full, not on a timer
+
+    def flush_due(self) -> Optional[float]:
+        return None
+
+    def close(self):
+        if self._file is not None and self._columns["url"]:
+            self._write_group()
+        super().close()
+
+def make_sink(path: str, keyword: str = "") -> ResultSink:
+    """A sink for `path`, chosen by extension: .csv, .jsonl, .jsonl.gz, .parquet, .arrow
+    or .sqlite / .db."""
+    name = path.lower()
+    if name.endswith(".csv"):
+        return CsvSink(path)
+    if name.endswith((".jsonl", ".jsonl.gz", ".ndjson", ".ndjson.gz")):
+        return JsonlSink(path)
+    if name.endswith((".sqlite", ".sqlite3", ".db")):
+        return SqliteSink(path, keyword)
+    if name.endswith((".parquet", ".arrow", ".feather")):
+        return ColumnarSink(path)
+    raise ValueError(f"unknown output format for {path} "
+                     "(use .csv, .jsonl, .jsonl.gz, .parquet, .arrow or .sqlite)")
+
+# ─── Seed Manifests ───────────────────────────────────────────────────────────
+def load_seeds(path: str, depth: int, max_pages: int, allow_subdomains: bool) -> list:
+    """Read a crawl manifest. Plain text is one URL per line ('#' starts a comment);
+    .json / .yaml files hold a list of URLs or of {url, depth, max_pages, subdomains}
+    objects (optionally under a top-level "seeds" key). Missing per-site settings
+    fall back to the command-line values."""
+    with open(path, encoding="utf-8") as f:
+        raw = f.read()
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        entries = json.loads(raw)
+    elif ext in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("YAML manifests need PyYAML — pip install pyyaml")
+        entries = yaml.safe_load(raw)
+    else:
+        entries = [line.split("#")[0].strip() for line in raw.splitlines()]
+        entries = [e for e in entries if e]
+    if isinstance(entries, dict):
+        entries = entries.get("seeds", [])
+
+    seeds = []
+    for entry in entries or []:
+        if isinstance(entry, str):
+            entry = {"url": entry}
+        url = entry["url"].strip()
+        if not url.startswith("http"):
+            url = "https://" + url
+        seeds.append(Seed(
+            url=url,
+            max_depth=int(entry.get("depth", depth)),
+            max_pages=int(entry.get("max_pages", max_pages)),
+            allow_subdomains=bool(entry.get("subdomains", allow_subdomains)),
+        ))
+    return seeds
@@ -11,33 +11,21 @@
 
 import sys
 import os
-import re
 import csv
-import time
-import threading
+import logging
+from logging.handlers import RotatingFileHandler
 from datetime import datetime
-from collections import defaultdict
-from threading import Lock
-from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
-from urllib.parse import urljoin, urlparse
+from collections import deque
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import tkinter.ttk as ttk
 
 import customtkinter as ctk
 
-# ── Scraper import ────────────────────────────────────────────────────────────
+# ── Engine import ─────────────────────────────────────────────────────────────
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 try:
-    from scraper import (
-        PageResult, fetch_page, make_session,
-        extract_names, extract_emails, extract_phones,
-        extract_departments, extract_snippets, count_keyword,
-        normalize_url, is_valid_url, setup_logger,
-    )
-    from bs4 import BeautifulSoup
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    from engine import CrawlRunner, HTTP_CACHE_FILE
     SCRAPER_OK = True
     SCRAPER_ERR = ""
 except ImportError as e:
@@ -118,6 +106,64 @@ DARK = {
 
 P = dict(LIGHT)
 
+UI_TICK_MS     = 100      # how often queued crawl events are applied to the UI
+UI_TICK_EVENTS = 20000    # most events handled per tick, so one tick can't stall
+STOP_GRACE_MS  = 5000     # a crawl process that ignores Stop this long is terminated
+
+# ── Activity log ──────────────────────────────────────────────────────────────
+# The log view keeps only the newest LOG_VIEW_LINES entries; every entry also goes
+# to LOG_FILE (rotated at LOG_FILE_BYTES, LOG_FILE_BACKUPS old files kept), which
+# is what the log search reads.
+LOG_VIEW_LINES   = 2000
+LOG_SEARCH_LIMIT = 2000   # newest matches shown for a search
+LOG_FILE         = "smartextract_gui.log"
+LOG_FILE_BYTES   = 5 * 2**20
+LOG_FILE_BACKUPS = 3
+LOG_TAGS         = ("all", "match", "crawl", "info", "done", "error")
+
+
+class LogSpill:
+    """Activity log entries as tab-separated lines — time, tag, message — in a
+    rotating file, and a streaming search over the file and its backups that
+    keeps only the newest `limit` matches in memory."""
+
+    def __init__(self, path=LOG_FILE):
+        self.path = path
+        self._log = logging.getLogger(f"smartextract.gui.{os.path.abspath(path)}")
+        self._log.propagate = False
+        self._log.setLevel(logging.INFO)
+        if not self._log.handlers:
+            handler = RotatingFileHandler(path, maxBytes=LOG_FILE_BYTES,
+                                          backupCount=LOG_FILE_BACKUPS, encoding="utf-8",
+                                          delay=True)
+            handler.setFormatter(logging.Formatter("%(asctime)s\t%(tag)s\t%(message)s",
+                                                   "%Y-%m-%d %H:%M:%S"))
+            self._log.addHandler(handler)
+
+    def write(self, msg, tag):
+        self._log.info(msg.replace("\n", " "), extra={"tag": tag})
+
+    def search(self, text="", tag="all", limit=LOG_SEARCH_LIMIT):
+        """[(timestamp, tag, message)] of the newest `limit` entries whose message
+        contains `text` (case-insensitive) and whose tag is `tag`, oldest first."""
+        needle = text.lower()
+        found = deque(maxlen=limit)
+        files = [f"{self.path}.{i}" for i in range(LOG_FILE_BACKUPS, 0, -1)] + [self.path]
+        for path in files:
+            if not os.path.exists(path):
+                continue
+            with open(path, encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    parts = line.rstrip("\n").split("\t", 2)
+                    if len(parts) != 3:
+                        continue
+                    if tag != "all" and parts[1] != tag:
+                        continue
+                    if needle and needle not in parts[2].lower():
+                        continue
+                    found.append(tuple(parts))
+        return list(found)
+
 # ── Fonts ─────────────────────────────────────────────────────────────────────
 F_BRAND  = ("Segoe UI", 14, "bold")
 F_LG     = ("Segoe UI", 12, "bold")
@@ -132,115 +178,6 @@ F_MONO_S = ("Consolas", 9)
 F_STAT   = ("Segoe UI", 26, "bold")
 
 
-# ══════════════════════════════════════════════════════════════════════════════
-#  CRAWLER
-# ══════════════════════════════════════════════════════════════════════════════
-class CrawlerWorker:
-    def __init__(self, start_url, keywords, max_depth, max_workers,
-                 rate_limit, allow_subdomains, timeout, max_pages,
-                 log_cb, result_cb, progress_cb, done_cb):
-        self.start_url        = start_url
-        self.keywords         = [k.strip() for k in re.split(r"[,;]+", keywords) if k.strip()]
-        self.max_depth        = max_depth
-        self.max_workers      = max_workers
-        self.rate_limit       = rate_limit
-        self.allow_subdomains = allow_subdomains
-        self.timeout          = timeout
-        self.max_pages        = max_pages
-        self._log      = log_cb
-        self._result   = result_cb
-        self._progress = progress_cb
-        self._done     = done_cb
-        self._stop     = False
-        self.base_domain = urlparse(start_url).netloc.lower()
-        self.visited   = set()
-        self.lock      = Lock()
-        self.stats     = defaultdict(int)
-        self.session   = make_session(timeout)
-        self.logger    = setup_logger(False)
-
-    def stop(self): self._stop = True
-
-    def _seen(self, url):
-        with self.lock:
-            if url in self.visited: return True
-            self.visited.add(url); return False
-
-    def _crawl(self, url, depth):
-        if self._stop: return []
-        time.sleep(self.rate_limit)
-        self._log(f"[{depth}/{self.max_depth}]  {url}", "crawl")
-        self.stats["crawled"] += 1
-        resp = fetch_page(self.session, url, self.timeout, logger=self.logger)
-        if not resp:
-            self.stats["failed"] += 1; return []
-        if "text/html" not in resp.headers.get("Content-Type", ""):
-            return []
-        soup  = BeautifulSoup(resp.text, "lxml")
-        text  = soup.get_text(separator=" ")
-        title = (soup.title.string.strip()
-                 if soup.title and soup.title.string else "")
-        hits  = sum(count_keyword(text, kw) for kw in self.keywords)
-        links = []
-        if hits > 0:
-            snippets, matched = [], []
-            for kw in self.keywords:
-                if count_keyword(text, kw) > 0:
-                    matched.append(kw)
-                    snippets.extend(extract_snippets(text, kw, max_snippets=2))
-            r = PageResult(
-                url=url, names=extract_names(text),
-                emails=extract_emails(text), phones=extract_phones(text),
-                departments=extract_departments(text),
-                matched_snippets=snippets, keyword_count=hits,
-                page_title=title, depth=depth)
-            r.matched_keywords = matched
-            with self.lock: self.stats["matched"] += 1
-            self._result(r)
-            self._log(f"● MATCH  {title or url}  [{', '.join(matched)}]  ×{hits}", "match")
-        self._progress(self.stats["crawled"], self.stats["matched"], self.max_pages)
-        if depth < self.max_depth:
-            for tag in soup.find_all("a", href=True):
-                full = normalize_url(urljoin(url, tag["href"]))
-                if is_valid_url(full, self.base_domain, self.allow_subdomains):
-                    links.append(full)
-        return links
-
-    def run(self):
-        self._log(f"Crawl started → {self.start_url}", "info")
-        self._log(f"Keywords: {' · '.join(self.keywords)}", "info")
-        frontier = [(self.start_url, 0)]
-        self.visited.add(normalize_url(self.start_url))
-        pending = 0
-        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
-            futures = {}
-            def fill():
-                nonlocal pending
-                while (frontier and not self._stop
-                       and len(futures)+pending < self.max_workers*4
-                       and self.stats["crawled"]+pending < self.max_pages):
-                    url, depth = frontier.pop(0)
-                    f = ex.submit(self._crawl, url, depth)
-                    futures[f] = (url, depth); pending += 1
-            fill()
-            while futures and not self._stop:
-                done, _ = wait(futures, timeout=0.5, return_when=FIRST_COMPLETED)
-                for f in done:
-                    url, depth = futures.pop(f); pending -= 1
-                    try:
-                        for link in (f.result() or []):
-                            if not self._seen(link):
-                                frontier.append((link, depth+1))
-                    except Exception as e:
-                        self.logger.error(str(e))
-                fill()
-        s = "Stopped" if self._stop else "Complete"
-        self._log(f"{s} — Crawled: {self.stats['crawled']}  "
-                  f"Matched: {self.stats['matched']}  "
-                  f"Failed: {self.stats['failed']}", "done")
-        self._done(self.stats["crawled"], self.stats["matched"])
-
-
 # ══════════════════════════════════════════════════════════════════════════════
 #  WIDGETS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -301,6 +238,130 @@ class CardFrame(ctk.CTkFrame):
             self._badge.configure(text=text)
 
 
+class VirtualTable(ctk.CTkFrame):
+    """Treeview onto a list it never copies. Only the rows that fit on screen exist
+    as Treeview items — a fixed pool of slots whose values are swapped as the view
+    scrolls — so 100k rows cost no more to draw than 20. `values(row)` gives a
+    row's cells; `select_cb` receives the index in `rows` of a newly selected row.
+    The selection belongs to that row, not to a slot: it scrolls with the row and
+    is hidden while the row is out of view. Call refresh() after changing `rows`;
+    the view follows new rows while it is scrolled to the bottom."""
+
+    def __init__(self, parent, rows, columns, values, select_cb, **kw):
+        super().__init__(parent, fg_color=P["CARD"], corner_radius=0, **kw)
+        self._rows    = rows
+        self._values  = values
+        self._select  = select_cb
+        self._top     = 0       # index in rows of the first visible row
+        self._slots   = 0       # Treeview items currently in the pool
+        self._follow  = True
+        self._chosen  = None    # index in rows of the selected row
+        self._heading = 40      # px above the first row; measured once rows exist
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in columns],
+                                 show="headings", selectmode="browse",
+                                 style="SE.Treeview", height=1)
+        for col, lbl, w, anch in columns:
+            self.tree.heading(col, text=lbl, anchor=anch)
+            self.tree.column(col, width=w, anchor=anch, minwidth=36)
+        self.tree.tag_configure("odd",  background=P["CARD"])
+        self.tree.tag_configure("even", background=P["CARD2"])
+
+        self._vsb = ctk.CTkScrollbar(self, command=self._on_scroll,
+                                     button_color=P["LGT"], button_hover_color=P["BRT"])
+        hsb = ctk.CTkScrollbar(self, orientation="horizontal",
+                               command=self.tree.xview,
+                               button_color=P["LGT"], button_hover_color=P["BRT"])
+        self.tree.configure(xscrollcommand=hsb.set)
+        self._vsb.pack(side="right", fill="y", padx=(0, 4), pady=4)
+        hsb.pack(side="bottom", fill="x", padx=4, pady=(0, 4))
+        self.tree.pack(fill="both", expand=True, padx=(4, 0), pady=4)
+
+        self.tree.bind("<Configure>", lambda _: self.refresh())
+        self.tree.bind("<MouseWheel>", lambda e: self._scroll_by(-3 if e.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda _: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda _: self._scroll_by(3))
+        self.tree.bind("<Up>", lambda _: self._step(-1))
+        self.tree.bind("<Down>", lambda _: self._step(1))
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+    def _visible(self):
+        row_h = int(ttk.Style().lookup("SE.Treeview", "rowheight") or 32)
+        return max(1, (self.tree.winfo_height() - self._heading) // row_h)
+
+    def refresh(self):
+        n, visible = len(self._rows), self._visible()
+        top = max(0, n - visible) if self._follow else min(self._top, max(0, n - visible))
+        self._top = top
+        shown = min(visible, n - top)
+        if self._chosen is not None and self._chosen >= n:
+            self._chosen = None     # rows was cleared
+        while self._slots < shown:
+            self.tree.insert("", "end", iid=str(self._slots))
+            self._slots += 1
+        while self._slots > shown:
+            self._slots -= 1
+            self.tree.delete(str(self._slots))
+        for slot in range(shown):
+            i = top + slot
+            self.tree.item(str(slot), values=self._values(self._rows[i]),
+                           tags=("even" if (i + 1) % 2 == 0 else "odd",))
+        # Highlight whichever slot now shows the selected row, if any does
+        slot = -1 if self._chosen is None else self._chosen - top
+        want = (str(slot),) if 0 <= slot < shown else ()
+        if self.tree.selection() != want:
+            self.tree.selection_set(want)
+        if want:
+            self.tree.focus(want[0])
+        if shown:
+            box = self.tree.bbox("0")
+            if box:
+                self._heading = box[1]
+            self._vsb.set(top / n, (top + shown) / n)
+        else:
+            self._vsb.set(0.0, 1.0)
+
+    def _scroll_to(self, top):
+        n, visible = len(self._rows), self._visible()
+        self._top = max(0, min(top, n - visible))
+        self._follow = self._top >= n - visible
+        self.refresh()
+
+    def _scroll_by(self, rows):
+        self._scroll_to(self._top + rows)
+
+    def _step(self, delta):
+        """Arrow keys: past the first or last slot, select the next row and
+        scroll it into that edge slot."""
+        sel = self.tree.selection()
+        if not sel or 0 <= int(sel[0]) + delta < self._slots:
+            return None         # Treeview moves the selection itself
+        row = self._top + int(sel[0]) + delta
+        if 0 <= row < len(self._rows):
+            self._chosen = row
+            self._scroll_by(delta)
+            # The edge slot stays selected, so Treeview sends no <<TreeviewSelect>>
+            self._select(row)
+        return "break"
+
+    def _on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self._rows)))
+        else:
+            step = self._visible() if unit == "pages" else 1
+            self._scroll_by(int(amount) * step)
+
+    def _on_select(self, _=None):
+        # Also sent for refresh()'s own selection changes, which pick no new row
+        sel = self.tree.selection()
+        if not sel:
+            return
+        row = self._top + int(sel[0])
+        if row < len(self._rows) and row != self._chosen:
+            self._chosen = row
+            self._select(row)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  MAIN APPLICATION
 # ══════════════════════════════════════════════════════════════════════════════
@@ -313,9 +374,15 @@ class App(ctk.CTk):
         self.configure(fg_color=P["ROOT"])
 
         self._results      = []   # ← persists across theme toggles
-        self._crawler      = None
+        self._n_emails     = 0    # running totals over _results
+        self._n_names      = 0
+        self._crawl        = None   # CrawlRunner of the current crawl, drained every UI_TICK_MS
         self._running      = False
         self._pulse_job    = None
+        self._log_ring     = deque(maxlen=LOG_VIEW_LINES)   # (time, msg, tag) on screen
+        self._log_spill    = LogSpill()
+        self._log_filter   = None   # (text, tag) while search results are shown
+        self._drain_job    = None
         self._pulse_step   = 0
         self._is_dark      = False
         self._crawl_stats  = (0, 0)   # (crawled, matched) — saved across toggle
@@ -335,26 +402,15 @@ class App(ctk.CTk):
         self._restore_results()
 
     def _restore_results(self):
-        """Re-populate tree & stat cards from in-memory _results after rebuild."""
+        """Re-populate table & stat cards from in-memory _results after rebuild."""
         if not self._results:
             return
-        for r in self._results:
-            mkw = getattr(r, "matched_keywords", [])
-            tag = "even" if (self._tree.index(self._tree.get_children()[-1]) + 1
-                             if self._tree.get_children() else 0) % 2 == 0 else "odd"
-            self._tree.insert("", "end", tags=(tag,), values=(
-                r.page_title or r.url,
-                ", ".join(mkw),
-                "; ".join(r.names[:2]) or "—",
-                ", ".join(r.emails[:2]) or "—",
-                r.keyword_count, r.depth))
-        te = sum(len(x.emails) for x in self._results)
-        tn = sum(len(x.names)  for x in self._results)
+        self._table.refresh()
         crawled, matched = self._crawl_stats
         self._c_crawled.set(crawled)
         self._c_matched.set(len(self._results))
-        self._c_emails.set(te)
-        self._c_names.set(tn)
+        self._c_emails.set(self._n_emails)
+        self._c_names.set(self._n_names)
         self._res_card.set_badge(f"{len(self._results):,} result(s)")
         self._prog_lbl.configure(text=f"{crawled:,} pages crawled")
         self._prog.set(min(1.0, crawled / max(self._pages.get(), 1)))
@@ -465,6 +521,20 @@ class App(ctk.CTk):
                         fg_color=P["BRT"], hover_color=P["VVD"],
                         border_color=P["SB_HOVER"], checkmark_color="#FFFFFF"
                         ).pack(anchor="w", padx=PD, pady=(0, 8))
+        self._use_cache = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(scr, text="Reuse cached pages",
+                        variable=self._use_cache,
+                        font=F_MED, text_color=P["STXT2"],
+                        fg_color=P["BRT"], hover_color=P["VVD"],
+                        border_color=P["SB_HOVER"], checkmark_color="#FFFFFF"
+                        ).pack(anchor="w", padx=PD, pady=(0, 8))
+        self._use_process = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(scr, text="Crawl in a separate process",
+                        variable=self._use_process,
+                        font=F_MED, text_color=P["STXT2"],
+                        fg_color=P["BRT"], hover_color=P["VVD"],
+                        border_color=P["SB_HOVER"], checkmark_color="#FFFFFF"
+                        ).pack(anchor="w", padx=PD, pady=(0, 8))
 
         hdiv()
 
@@ -624,8 +694,35 @@ class App(ctk.CTk):
 
     # ── Log tab ───────────────────────────────────────────────────────────────
     def _build_log_tab(self, parent):
-        card = CardFrame(parent, title="Live Activity Feed", badge="")
+        card = self._log_card = CardFrame(parent, title="Live Activity Feed", badge="")
         card.grid(row=0, column=0, sticky="nsew")
+
+        bar = ctk.CTkFrame(card, fg_color=P["CARD"], corner_radius=0)
+        bar.pack(fill="x", padx=10, pady=(8, 0))
+        self._log_query = ctk.StringVar()
+        self._log_tag   = ctk.StringVar(value="all")
+        entry = ctk.CTkEntry(bar, textvariable=self._log_query,
+                             placeholder_text="Search the full log…",
+                             fg_color=P["CARD2"], border_color=P["BDR"],
+                             text_color=P["TDK"], placeholder_text_color=P["TXLT"],
+                             font=F_MONO_S, height=30, corner_radius=8)
+        entry.pack(side="left", fill="x", expand=True)
+        entry.bind("<Return>", lambda _: self._log_search())
+        ctk.CTkOptionMenu(bar, variable=self._log_tag, values=list(LOG_TAGS),
+                          fg_color=P["CARD2"], button_color=P["LGT"],
+                          button_hover_color=P["BRT"], text_color=P["TMED"],
+                          font=F_XS, width=90, height=30
+                          ).pack(side="left", padx=(8, 0))
+        ctk.CTkButton(bar, text="Find", command=self._log_search,
+                      fg_color=P["PRI"], hover_color=P["BRT"], text_color="#FFFFFF",
+                      font=F_XS_B, width=64, height=30, corner_radius=8
+                      ).pack(side="left", padx=(8, 0))
+        ctk.CTkButton(bar, text="Live", command=self._log_live,
+                      fg_color="transparent", hover_color=P["XLT"], text_color=P["TMED"],
+                      border_width=1, border_color=P["BDR"],
+                      font=F_XS_B, width=64, height=30, corner_radius=8
+                      ).pack(side="left", padx=(8, 0))
+
         inner = ctk.CTkFrame(card, fg_color=P["CARD"], corner_radius=0)
         inner.pack(fill="both", expand=True)
         self._log = tk.Text(inner,
@@ -655,6 +752,11 @@ class App(ctk.CTk):
         self._log.tag_configure("fulldiv",
                                 foreground=P["SEP_CLR"],
                                 font=("Consolas", 7))
+        # After a theme rebuild, show the same view again
+        if self._log_filter:
+            self._log_search(*self._log_filter)
+        else:
+            self._log_live()
 
     # ── Results tab ───────────────────────────────────────────────────────────
     def _build_results_tab(self, parent):
@@ -676,36 +778,23 @@ class App(ctk.CTk):
                   background=[("selected", P["XLT"])],
                   foreground=[("selected", P["TDK"])])
 
-        inner = ctk.CTkFrame(self._res_card, fg_color=P["CARD"], corner_radius=0)
-        inner.pack(fill="both", expand=True)
-
-        cols = ("title", "kw", "names", "emails", "hits", "d")
-        self._tree = ttk.Treeview(inner, columns=cols,
-                                   show="headings", selectmode="browse",
-                                   style="SE.Treeview")
-        for col, lbl, w, anch in [
+        self._table = VirtualTable(self._res_card, self._results, [
             ("title",  "Page Title",   290, "w"),
             ("kw",     "Keywords Hit", 140, "w"),
             ("names",  "Names",        155, "w"),
             ("emails", "Email",        175, "w"),
             ("hits",   "Hits",          52, "center"),
             ("d",      "D",             36, "center"),
-        ]:
-            self._tree.heading(col, text=lbl, anchor=anch)
-            self._tree.column(col, width=w, anchor=anch, minwidth=36)
-        self._tree.tag_configure("odd",  background=P["CARD"])
-        self._tree.tag_configure("even", background=P["CARD2"])
-
-        vsb = ctk.CTkScrollbar(inner, command=self._tree.yview,
-                                button_color=P["LGT"], button_hover_color=P["BRT"])
-        hsb = ctk.CTkScrollbar(inner, orientation="horizontal",
-                                command=self._tree.xview,
-                                button_color=P["LGT"], button_hover_color=P["BRT"])
-        self._tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        vsb.pack(side="right", fill="y", padx=(0, 4), pady=4)
-        hsb.pack(side="bottom", fill="x", padx=4, pady=(0, 4))
-        self._tree.pack(fill="both", expand=True, padx=(4, 0), pady=4)
-        self._tree.bind("<<TreeviewSelect>>", self._on_select)
+        ], self._row_values, self._on_select)
+        self._table.pack(fill="both", expand=True)
+
+    @staticmethod
+    def _row_values(r):
+        return (r.page_title or r.url,
+                ", ".join(getattr(r, "matched_keywords", [])),
+                "; ".join(r.names[:2])  or "—",
+                ", ".join(r.emails[:2]) or "—",
+                r.keyword_count, r.depth)
 
     # ── Detail tab ────────────────────────────────────────────────────────────
     def _build_detail_tab(self, parent):
@@ -775,7 +864,7 @@ class App(ctk.CTk):
     def _start(self):
         if not SCRAPER_OK:
             messagebox.showerror("Import Error",
-                f"scraper.py could not be loaded:\n{SCRAPER_ERR}")
+                f"engine.py could not be loaded:\n{SCRAPER_ERR}")
             return
         url = self._url.get().strip()
         kw  = self._kw.get().strip()
@@ -787,8 +876,9 @@ class App(ctk.CTk):
             url = "https://" + url
 
         self._results.clear()
+        self._n_emails = self._n_names = 0
         self._crawl_stats = (0, 0)
-        for row in self._tree.get_children(): self._tree.delete(row)
+        self._table.refresh()
         self._log_clear(); self._detail_clear()
         for c in (self._c_crawled, self._c_matched, self._c_emails, self._c_names):
             c.set(0)
@@ -804,25 +894,33 @@ class App(ctk.CTk):
         self._set_status("Running…", P["GLOW"])
         self._pulse_start()
 
-        self._crawler = CrawlerWorker(
-            start_url=url, keywords=kw,
+        options = dict(
+            start_url=url, keyword=kw,
             max_depth=self._depth.get(),
             max_workers=self._workers.get(),
             rate_limit=self._rate.get(),
             allow_subdomains=self._subdomain.get(),
             timeout=12, max_pages=self._pages.get(),
-            log_cb=lambda m, t: self.after(0, self._log_append, m, t),
-            result_cb=lambda r: self.after(0, self._add_result, r),
-            progress_cb=lambda c, m, t: self.after(0, self._update_prog, c, m, t),
-            done_cb=lambda c, m: self.after(0, self._on_done, c, m),
+            cache_path=HTTP_CACHE_FILE if self._use_cache.get() else None,
         )
-        threading.Thread(target=self._crawler.run, daemon=True).start()
+        # In a process, parsing competes with the crawl's own cores, not the UI's GIL
+        self._crawl = CrawlRunner(options, process=self._use_process.get())
+        self._crawl.start()
+        if self._drain_job is None:
+            self._drain_job = self.after(UI_TICK_MS, self._drain_events)
 
     def _stop_crawl(self):
-        if self._crawler: self._crawler.stop()
+        if self._crawl:
+            self._crawl.stop()
+            if self._crawl.process:
+                self.after(STOP_GRACE_MS, self._kill_crawl, self._crawl)
         self._set_status("Stopping…", P["WRN"])
         self._btn_stop.configure(state="disabled")
 
+    def _kill_crawl(self, crawl):
+        if crawl.kill():
+            self._log_append("Crawl process terminated", "error")
+
     def _export(self):
         if not self._results:
             messagebox.showinfo("No Data", "No results to export."); return
@@ -851,8 +949,9 @@ class App(ctk.CTk):
 
     def _clear(self):
         self._results.clear()
+        self._n_emails = self._n_names = 0
         self._crawl_stats = (0, 0)
-        for row in self._tree.get_children(): self._tree.delete(row)
+        self._table.refresh()
         self._log_clear(); self._detail_clear()
         for c in (self._c_crawled, self._c_matched, self._c_emails, self._c_names):
             c.set(0)
@@ -867,43 +966,99 @@ class App(ctk.CTk):
         self._toggle_btn.configure(state="normal")
 
     # ── Live update handlers ──────────────────────────────────────────────────
+    def _drain_events(self):
+        """Apply what the crawl queued since the last tick in one go: log lines
+        and results in bulk, progress only at its latest value."""
+        lines, results, progress, done = self._crawl.drain(UI_TICK_EVENTS)
+        if lines:
+            self._log_append_many(lines)
+        if results:
+            self._add_results(results)
+        if progress:
+            self._update_prog(*progress)
+        if done:
+            self._on_done(*done)
+        if self._running or self._crawl.pending():
+            self._drain_job = self.after(UI_TICK_MS, self._drain_events)
+        else:
+            self._drain_job = None
+
     def _log_append(self, msg, tag):
-        self._log.configure(state="normal")
+        self._log_append_many([(msg, tag)])
+
+    def _log_append_many(self, lines):
         ts = datetime.now().strftime("%H:%M:%S")
+        for msg, tag in lines:
+            self._log_spill.write(msg, tag)
+            self._log_ring.append((ts, msg, tag))
+        if self._log_filter:
+            return   # search results stay put; "Live" brings the feed back
+        if len(lines) >= LOG_VIEW_LINES:
+            self._log_render(self._log_ring)
+            return
+        self._log.configure(state="normal")
+        for msg, tag in lines:
+            self._log_insert(ts, msg, tag)
+        # Drop the oldest entries beyond what the ring holds
+        excess = len(self._log.tag_ranges("entry")) // 2 - LOG_VIEW_LINES
+        if excess > 0:
+            self._log.delete("1.0", str(self._log.tag_ranges("entry")[2 * excess]))
+        self._log.see("end")
+        self._log.configure(state="disabled")
+
+    def _log_insert(self, ts, msg, tag):
+        # "entry" marks the first character of each entry, to trim by entry count
         if tag == "match":
-            self._log.insert("end", f"[{ts}] ", "ts")
+            self._log.insert("end", "[", ("ts", "entry"), f"{ts}] ", "ts")
             self._log.insert("end", "● ", "dot")
             self._log.insert("end", f"{msg}\n", "match")
         elif tag == "done":
             # Full-width divider line
-            self._log.insert("end", "\n")
+            self._log.insert("end", "\n", "entry")
             self._log.insert("end", "─" * 120 + "\n", "fulldiv")
             self._log.insert("end", f"[{ts}]  ", "ts")
             self._log.insert("end", msg + "\n", "done")
             self._log.insert("end", "─" * 120 + "\n\n", "fulldiv")
         else:
-            self._log.insert("end", f"[{ts}] ", "ts")
+            self._log.insert("end", "[", ("ts", "entry"), f"{ts}] ", "ts")
             self._log.insert("end", f"{msg}\n", tag)
+
+    def _log_render(self, entries):
+        self._log.configure(state="normal")
+        self._log.delete("1.0", "end")
+        for ts, msg, tag in entries:
+            self._log_insert(ts, msg, tag)
         self._log.see("end")
         self._log.configure(state="disabled")
 
-    def _add_result(self, r):
-        self._results.append(r)
-        mkw = getattr(r, "matched_keywords", [])
-        tag = "even" if len(self._results) % 2 == 0 else "odd"
-        iid = self._tree.insert("", "end", tags=(tag,), values=(
-            r.page_title or r.url,
-            ", ".join(mkw),
-            "; ".join(r.names[:2])  or "—",
-            ", ".join(r.emails[:2]) or "—",
-            r.keyword_count, r.depth))
-        self._tree.see(iid)
+    def _log_search(self, text=None, tag=None):
+        """Show the newest entries of the whole spilled log that match the search box."""
+        text = self._log_query.get().strip() if text is None else text
+        tag  = self._log_tag.get() if tag is None else tag
+        if not text and tag == "all":
+            self._log_live(); return
+        self._log_filter = (text, tag)
+        found = self._log_spill.search(text, tag)
+        # File times carry the date; the view shows the time of day only
+        self._log_render((ts[-8:], msg, t) for ts, t, msg in found)
+        more = "+" if len(found) >= LOG_SEARCH_LIMIT else ""
+        self._log_card.set_badge(f"{len(found):,}{more} match(es) in {self._log_spill.path}")
+
+    def _log_live(self):
+        self._log_filter = None
+        self._log_render(self._log_ring)
+        self._log_card.set_badge("")
+
+    def _add_results(self, rs):
+        self._results.extend(rs)
+        for r in rs:
+            self._n_emails += len(r.emails)
+            self._n_names  += len(r.names)
+        self._table.refresh()
         self._res_card.set_badge(f"{len(self._results):,} result(s)")
-        te = sum(len(x.emails) for x in self._results)
-        tn = sum(len(x.names)  for x in self._results)
         self._c_matched.set(len(self._results))
-        self._c_emails.set(te)
-        self._c_names.set(tn)
+        self._c_emails.set(self._n_emails)
+        self._c_names.set(self._n_names)
 
     def _update_prog(self, crawled, matched, total):
         self._crawl_stats = (crawled, matched)
@@ -927,13 +1082,9 @@ class App(ctk.CTk):
             self._btn_export.configure(state="normal",
                                        fg_color=P["PRI"], text_color="#FFFFFF")
 
-    def _on_select(self, _=None):
-        sel = self._tree.selection()
-        if not sel: return
-        idx = self._tree.index(sel[0])
-        if 0 <= idx < len(self._results):
-            self._render_detail(self._results[idx])
-            self._show_tab("detail")
+    def _on_select(self, idx):
+        self._render_detail(self._results[idx])
+        self._show_tab("detail")
 
     # ── Detail renderer ───────────────────────────────────────────────────────
     def _render_detail(self, r):
@@ -1006,6 +1157,10 @@ class App(ctk.CTk):
         self._dot.configure(text_color=color)
 
     def _log_clear(self):
+        # The log file keeps everything; only the view starts over
+        self._log_ring.clear()
+        self._log_filter = None
+        self._log_card.set_badge("")
         self._log.configure(state="normal")
         self._log.delete("1.0", "end")
         self._log.configure(state="disabled")
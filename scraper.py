@@ -3,42 +3,22 @@
 ║        ADVANCED SMART PROFESSOR + KEYWORD EXTRACTOR TOOL        ║
 ║              Multi-threaded | Smart NLP | Rich Output           ║
 ╚══════════════════════════════════════════════════════════════════╝
+
+Command-line front-end; the crawling itself lives in engine.py.
 """
 
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-import urllib3
-import csv
-import time
 import re
-import json
-import logging
-import argparse
 import sys
-import os
+import argparse
 from datetime import datetime
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock, Semaphore
-from dataclasses import dataclass, field, asdict
 from typing import Optional
-from queue import Queue, Empty
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-# ─── ANSI Colors ────────────────────────────────────────────────────────────────
-class C:
-    RESET   = "\033[0m"
-    BOLD    = "\033[1m"
-    RED     = "\033[91m"
-    GREEN   = "\033[92m"
-    YELLOW  = "\033[93m"
-    BLUE    = "\033[94m"
-    MAGENTA = "\033[95m"
-    CYAN    = "\033[96m"
-    WHITE   = "\033[97m"
-    GREY    = "\033[90m"
+from engine import (
+    C, PageResult, CrawlEngine, make_engine, split_keywords, keyword_pattern,
+    JobCheckpoint, SqliteSink, make_sink, save_changes_csv, load_seeds,
+    ENGINES, STRATEGIES, FRONTIER_KINDS, VISITED_KINDS, HTTP_CACHE_FILE, PAGE_INDEX_FILE,
+)
 
 def banner():
     print(f"""
@@ -49,277 +29,14 @@ def banner():
 ╚══════════════════════════════════════════════════════════════════╝
 {C.RESET}""")
 
-# ─── Logging ─────────────────────────────────────────────────────────────────
-def setup_logger(verbose: bool) -> logging.Logger:
-    logger = logging.getLogger("extractor")
-    logger.setLevel(logging.DEBUG if verbose else logging.WARNING)
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter(f"{C.GREY}[%(levelname)s] %(message)s{C.RESET}"))
-    logger.addHandler(handler)
-    file_handler = logging.FileHandler("extractor.log", encoding="utf-8")
-    file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-    logger.addHandler(file_handler)
-    return logger
-
-# ─── Data Model ──────────────────────────────────────────────────────────────
-@dataclass
-class PageResult:
-    url: str
-    names: list = field(default_factory=list)
-    emails: list = field(default_factory=list)
-    phones: list = field(default_factory=list)
-    departments: list = field(default_factory=list)
-    matched_snippets: list = field(default_factory=list)
-    keyword_count: int = 0
-    page_title: str = ""
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
-    depth: int = 0
-
-# ─── Extraction Patterns ─────────────────────────────────────────────────────
-EMAIL_RE    = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
-PHONE_RE    = re.compile(r"(?:\+?\d[\d\s\-().]{7,}\d)")
-
-# Captures full name after title: handles "Dr. A.K. Singh", "Prof. Rama Murthy",
-# "Dr. S. K. Sharma", "Prof. Mary-Jane O'Brien" — up to 5 name parts
-NAME_RE = re.compile(
-    r"\b((?:Prof(?:essor)?\.?|Dr\.?|Assoc(?:iate)?\.?\s+Prof(?:essor)?\.?|"
-    r"Asst\.?\s+Prof(?:essor)?\.?|Emeritus\s+Prof(?:essor)?\.?)"
-    r"\s+"
-    r"(?:[A-Z][a-zA-Z'\-]*\.?\s+){1,5}"   # 1-5 name parts (initials or full words)
-    r"[A-Z][a-zA-Z'\-]+)"                  # last part must be a real word (no trailing dot)
-    , re.UNICODE
-)
-
-DEPT_RE = re.compile(
-    r"(?:Department|Dept\.?|School|Faculty|Division)\s+of\s+"
-    r"([A-Z][A-Za-z\s&,]+?)(?:\.|,|\n|<)",
-    re.IGNORECASE
-)
-
-def _make_word_pattern(keyword: str) -> re.Pattern:
-    """Build a whole-word regex for a keyword. Handles short abbreviations like IoT, 5G."""
-    escaped = re.escape(keyword)
-    # Use word boundaries; for keywords ending/starting with non-word chars (5G, C++),
-    # fall back to lookaround boundaries
-    try:
-        return re.compile(r"\b" + escaped + r"\b", re.IGNORECASE)
-    except re.error:
-        return re.compile(r"(?<!\w)" + escaped + r"(?!\w)", re.IGNORECASE)
-
-# Cache compiled patterns per keyword
-_KW_PATTERN_CACHE: dict = {}
-
-def _get_kw_pattern(keyword: str) -> re.Pattern:
-    if keyword not in _KW_PATTERN_CACHE:
-        _KW_PATTERN_CACHE[keyword] = _make_word_pattern(keyword)
-    return _KW_PATTERN_CACHE[keyword]
-
-def extract_emails(text: str) -> list:
-    return list(dict.fromkeys(EMAIL_RE.findall(text)))
-
-def extract_phones(text: str) -> list:
-    raw = PHONE_RE.findall(text)
-    cleaned = []
-    for p in raw:
-        p = p.strip()
-        digits = re.sub(r"\D", "", p)
-        if 7 <= len(digits) <= 15:
-            cleaned.append(p)
-    return list(dict.fromkeys(cleaned))[:5]
-
-def extract_names(text: str) -> list:
-    raw = [m.group(0).strip() for m in NAME_RE.finditer(text)]
-    # Clean up excessive whitespace inside names
-    cleaned = [re.sub(r"\s{2,}", " ", n) for n in raw]
-    return list(dict.fromkeys(cleaned))[:10]
-
-def extract_departments(text: str) -> list:
-    return list(dict.fromkeys(m.group(1).strip() for m in DEPT_RE.finditer(text)))[:5]
-
-def extract_snippets(text: str, keyword: str, window: int = 120, max_snippets: int = 5) -> list:
-    """Extract keyword-in-context snippets using whole-word matching."""
-    snippets = []
-    pattern = _get_kw_pattern(keyword)
-    for m in pattern.finditer(text):
-        if len(snippets) >= max_snippets:
-            break
-        pos   = m.start()
-        start = max(0, pos - window)
-        end   = min(len(text), pos + len(keyword) + window)
-        snippet = text[start:end].replace("\n", " ").strip()
-        snippets.append(snippet)
-    return snippets
-
-def count_keyword(text: str, keyword: str) -> int:
-    """Count whole-word occurrences only — avoids 'IoT' matching 'BIoTechnology'."""
-    return len(_get_kw_pattern(keyword).findall(text))
-
-# ─── URL Helpers ─────────────────────────────────────────────────────────────
-SKIP_EXTENSIONS = {
-    ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
-    ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp",
-    ".zip", ".tar", ".gz", ".mp4", ".mp3", ".avi", ".mov",
-    ".css", ".js", ".woff", ".woff2", ".ttf",
-}
-
-def is_valid_url(url: str, base_domain: str, allow_subdomains: bool = False) -> bool:
-    try:
-        parsed = urlparse(url)
-        if parsed.scheme not in ("http", "https"):
-            return False
-        domain = parsed.netloc.lower()
-        if allow_subdomains:
-            if not (domain == base_domain or domain.endswith("." + base_domain)):
-                return False
-        else:
-            if domain != base_domain:
-                return False
-        ext = os.path.splitext(parsed.path.lower())[1]
-        if ext in SKIP_EXTENSIONS:
-            return False
-        return True
-    except Exception:
-        return False
-
-def normalize_url(url: str) -> str:
-    return url.split("#")[0].rstrip("/")
-
-# ─── HTTP Session ─────────────────────────────────────────────────────────────
-def make_session(timeout: int = 10) -> requests.Session:
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Connection": "keep-alive",
-    })
-    return session
-
-def fetch_page(session: requests.Session, url: str, timeout: int = 10,
-               retries: int = 3, logger: logging.Logger = None) -> Optional[requests.Response]:
-    for attempt in range(1, retries + 1):
-        try:
-            resp = session.get(url, timeout=timeout, verify=False, allow_redirects=True)
-            if resp.status_code == 200:
-                return resp
-            if resp.status_code in (403, 404, 410):
-                return None
-            if resp.status_code == 429:
-                wait = 2 ** attempt
-                if logger: logger.warning(f"Rate limited on {url}, waiting {wait}s")
-                time.sleep(wait)
-        except requests.exceptions.Timeout:
-            if logger: logger.debug(f"Timeout on {url} (attempt {attempt})")
-        except requests.exceptions.ConnectionError:
-            if logger: logger.debug(f"Connection error on {url} (attempt {attempt})")
-        except Exception as e:
-            if logger: logger.debug(f"Error fetching {url}: {e}")
-            return None
-        if attempt < retries:
-            time.sleep(0.5 * attempt)
-    return None
-
-# ─── Core Crawler ─────────────────────────────────────────────────────────────
-class Crawler:
-    def __init__(self, start_url: str, keyword: str, max_depth: int = 2,
-                 max_workers: int = 5, rate_limit: float = 0.3,
-                 allow_subdomains: bool = False, verbose: bool = False,
-                 timeout: int = 10, max_pages: int = 200):
-        self.start_url       = start_url
-        self.keyword         = keyword  # original string (for display)
-        # Split comma/semicolon separated keywords, strip whitespace, remove empty
-        self.keywords        = [k.strip() for k in re.split(r"[,;]+", keyword) if k.strip()]
-        self.max_depth       = max_depth
-        self.max_workers     = max_workers
-        self.rate_limit      = rate_limit
-        self.allow_subdomains = allow_subdomains
-        self.timeout         = timeout
-        self.max_pages       = max_pages
-        self.verbose         = verbose
-
-        parsed = urlparse(start_url)
-        self.base_domain = parsed.netloc.lower()
-
-        self.visited: set       = set()
-        self.results: list      = []
-        self.queue              = Queue()
-        self.lock               = Lock()
-        self.rate_sem           = Semaphore(max_workers)
-        self.pages_crawled      = 0
-        self.logger             = setup_logger(verbose)
-        self.stats              = defaultdict(int)
-        self.session            = make_session(timeout)
-
-    def _already_visited(self, url: str) -> bool:
-        with self.lock:
-            if url in self.visited:
-                return True
-            self.visited.add(url)
-            return False
-
-    def _crawl_page(self, url: str, depth: int):
-        with self.rate_sem:
-            time.sleep(self.rate_limit)
-
-        print(f"{C.GREY}🔍 Crawling [{depth}/{self.max_depth}]: {url}{C.RESET}")
-        self.logger.debug(f"Crawling depth={depth}: {url}")
-        self.stats["crawled"] += 1
-
-        resp = fetch_page(self.session, url, self.timeout, logger=self.logger)
-        if resp is None:
-            self.stats["failed"] += 1
-            return []
-
-        content_type = resp.headers.get("Content-Type", "")
-        if "text/html" not in content_type:
-            return []
-
-        soup  = BeautifulSoup(resp.text, "lxml")
-        text  = soup.get_text(separator=" ")
-        title = soup.title.string.strip() if soup.title and soup.title.string else ""
-
-        kw_count = sum(count_keyword(text, kw) for kw in self.keywords)
-        new_links = []
-
-        if kw_count > 0:
-            # Gather snippets for each matched keyword
-            all_snippets = []
-            matched_kws = []
-            for kw in self.keywords:
-                if count_keyword(text, kw) > 0:
-                    matched_kws.append(kw)
-                    all_snippets.extend(extract_snippets(text, kw, max_snippets=2))
-
-            result = PageResult(
-                url=url,
-                names=extract_names(text),
-                emails=extract_emails(text),
-                phones=extract_phones(text),
-                departments=extract_departments(text),
-                matched_snippets=all_snippets,
-                keyword_count=kw_count,
-                page_title=title,
-                depth=depth,
-            )
-            result.matched_keywords = matched_kws  # store which keywords hit
-            with self.lock:
-                self.results.append(result)
-            self.stats["matched"] += 1
-            self._print_result(result)
+# ─── Console Output ──────────────────────────────────────────────────────────
+class ConsoleReporter:
+    """CrawlEngine hooks that print matches and progress to the terminal."""
 
-        if depth < self.max_depth:
-            for tag in soup.find_all("a", href=True):
-                full_url = normalize_url(urljoin(url, tag["href"]))
-                if is_valid_url(full_url, self.base_domain, self.allow_subdomains):
-                    new_links.append(full_url)
+    def __init__(self, keywords: list):
+        self.keywords = keywords
 
-        return new_links
-
-    def _print_result(self, r: PageResult):
+    def on_result(self, r: PageResult):
         sep = f"{C.CYAN}{'─'*68}{C.RESET}"
         matched_kws = getattr(r, "matched_keywords", self.keywords)
         print(f"\n{sep}")
@@ -339,100 +56,59 @@ class Crawler:
             snippet = r.matched_snippets[0][:200]
             # Highlight ALL keywords in the snippet — whole-word only
             for kw in self.keywords:
-                snippet = _get_kw_pattern(kw).sub(
+                snippet = keyword_pattern(kw).sub(
                     lambda m: f"{C.RED}{C.BOLD}{m.group(0)}{C.RESET}", snippet
                 )
             print(f"{C.YELLOW}🔎 Snippet  :{C.RESET} …{snippet}…")
         print(sep)
 
-    def run(self):
+    def on_log(self, message: str, kind: str):
+        # Start and end are covered by start() and summary()
+        if kind == "crawl":
+            print(f"{C.GREY}🔍 Crawling {message}{C.RESET}")
+
+    def start(self, crawler: CrawlEngine):
         kw_display = " | ".join(f"{C.BOLD}{k}{C.RESET}{C.CYAN}" for k in self.keywords)
-        print(f"\n{C.CYAN}🚀 Starting crawl of {C.BOLD}{self.start_url}{C.RESET}")
+        if len(crawler.seeds) > 1:
+            print(f"\n{C.CYAN}🚀 Starting crawl of {C.BOLD}{len(crawler.seeds)} sites{C.RESET}")
+        else:
+            print(f"\n{C.CYAN}🚀 Starting crawl of {C.BOLD}{crawler.start_url}{C.RESET}")
         print(f"{C.CYAN}   Keywords : {kw_display}{C.RESET}")
-        print(f"{C.CYAN}   Max depth: {self.max_depth}  |  Workers: {self.max_workers}{C.RESET}\n")
-
-        # BFS with thread pool
-        frontier = [(self.start_url, 0)]
-        self.visited.add(normalize_url(self.start_url))
-
-        while frontier and self.pages_crawled < self.max_pages:
-            batch = []
-            while frontier and len(batch) < self.max_workers * 2:
-                item = frontier.pop(0)
-                batch.append(item)
+        print(f"{C.CYAN}   Max depth: {crawler.max_depth}  |  Workers: {crawler.max_workers}{C.RESET}\n")
 
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {
-                    executor.submit(self._crawl_page, url, depth): (url, depth)
-                    for url, depth in batch
-                    if self.pages_crawled < self.max_pages
-                }
-                for future in as_completed(futures):
-                    url, depth = futures[future]
-                    self.pages_crawled += 1
-                    try:
-                        new_links = future.result()
-                        if depth < self.max_depth:
-                            for link in new_links:
-                                if not self._already_visited(link):
-                                    frontier.append((link, depth + 1))
-                    except Exception as e:
-                        self.logger.error(f"Error processing {url}: {e}")
+    def changes(self, counts: dict, path: Optional[str]):
+        print(f"\n{C.BOLD}🔁 Since last run: {C.GREEN}{counts['new']} new{C.RESET}{C.BOLD}, "
+              f"{C.YELLOW}{counts['changed']} changed{C.RESET}{C.BOLD}, "
+              f"{C.RED}{counts['removed']} removed{C.RESET}")
+        if path:
+            print(f"{C.GREEN}✅ Changes saved → {path} ({sum(counts.values())} rows){C.RESET}")
 
-        self._print_summary()
-
-    def _print_summary(self):
+    def summary(self, crawler: CrawlEngine):
         print(f"\n{C.CYAN}{'═'*68}{C.RESET}")
         print(f"{C.BOLD}{C.WHITE}📊 CRAWL SUMMARY{C.RESET}")
-        print(f"  Pages crawled  : {C.GREEN}{self.stats['crawled']}{C.RESET}")
-        print(f"  Pages matched  : {C.GREEN}{self.stats['matched']}{C.RESET}")
-        print(f"  Failed/Skipped : {C.YELLOW}{self.stats['failed']}{C.RESET}")
-        total_emails = sum(len(r.emails) for r in self.results)
-        total_names  = sum(len(r.names)  for r in self.results)
+        print(f"  Pages crawled  : {C.GREEN}{crawler.stats['crawled']}{C.RESET}")
+        print(f"  Pages matched  : {C.GREEN}{crawler.stats['matched']}{C.RESET}")
+        if crawler.stats["crawled"]:
+            rate = crawler.stats["matched"] * 1000 / crawler.stats["crawled"]
+            print(f"  Match rate     : {C.GREEN}{rate:.0f}{C.RESET} per 1,000 pages")
+        print(f"  Failed/Skipped : {C.YELLOW}{crawler.stats['failed']}{C.RESET}")
+        print(f"  Pre-filtered   : {C.GREY}{crawler.stats['prefiltered']}{C.RESET}")
+        if crawler.cache:
+            print(f"  From cache     : {C.GREY}{crawler.cache.hits}{C.RESET} (304 Not Modified)")
+        if crawler.index:
+            print(f"  Unchanged      : {C.GREY}{crawler.stats['unchanged']}{C.RESET} (reused from last run)")
+        if crawler.near_dupes:
+            print(f"  Near-dupes     : {C.GREY}{crawler.stats['duplicates']}{C.RESET} (pruned)")
+        total_emails = sum(len(r.emails) for r in crawler.results)
+        total_names  = sum(len(r.names)  for r in crawler.results)
         print(f"  Unique emails  : {C.GREEN}{total_emails}{C.RESET}")
         print(f"  Names found    : {C.GREEN}{total_names}{C.RESET}")
+        if len(crawler.seeds) > 1:
+            print(f"  {C.BOLD}Per site{C.RESET}")
+            for site in crawler.seeds:
+                print(f"    {site.url:<48} {C.GREEN}{site.matched:>4}{C.RESET} / {site.pages_crawled} pages")
         print(f"{C.CYAN}{'═'*68}{C.RESET}\n")
 
-# ─── Output Saving ────────────────────────────────────────────────────────────
-def save_csv(results: list, filename: str):
-    with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "URL", "Page Title", "Keyword Hits", "Names", "Emails",
-            "Phones", "Departments", "Top Snippet", "Depth", "Timestamp"
-        ])
-        for r in results:
-            writer.writerow([
-                r.url,
-                r.page_title,
-                r.keyword_count,
-                " | ".join(r.names),
-                " | ".join(r.emails),
-                " | ".join(r.phones),
-                " | ".join(r.departments),
-                r.matched_snippets[0][:300] if r.matched_snippets else "",
-                r.depth,
-                r.timestamp,
-            ])
-    print(f"{C.GREEN}✅ CSV saved → {filename}{C.RESET}")
-
-def save_json(results: list, filename: str):
-    data = [asdict(r) for r in results]
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"{C.GREEN}✅ JSON saved → {filename}{C.RESET}")
-
-def save_email_list(results: list, filename: str):
-    """Deduplicated email list for easy copy-paste."""
-    all_emails = []
-    for r in results:
-        all_emails.extend(r.emails)
-    unique = list(dict.fromkeys(all_emails))
-    with open(filename, "w", encoding="utf-8") as f:
-        for email in unique:
-            f.write(email + "\n")
-    print(f"{C.GREEN}✅ Email list saved → {filename} ({len(unique)} unique emails){C.RESET}")
-
 # ─── CLI ──────────────────────────────────────────────────────────────────────
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -446,27 +122,146 @@ Examples:
         """
     )
     parser.add_argument("--url",        help="Starting URL to crawl")
+    parser.add_argument("--seeds",      metavar="FILE",
+                        help="Crawl every site in a manifest (one URL per line, or JSON/YAML)")
     parser.add_argument("--keyword",    help="Keyword to search for")
     parser.add_argument("--depth",      type=int, default=2,   help="Max crawl depth (default: 2)")
     parser.add_argument("--workers",    type=int, default=5,   help="Concurrent threads (default: 5)")
-    parser.add_argument("--rate",       type=float, default=0.3, help="Delay between requests (default: 0.3s)")
+    parser.add_argument("--engine",     choices=ENGINES, default="threads",
+                        help="Crawl engine: thread pool or asyncio/aiohttp (default: threads)")
+    parser.add_argument("--concurrency", type=int, default=100,
+                        help="Max in-flight requests for --engine async (default: 100)")
+    parser.add_argument("--parse-procs", type=int, default=0, metavar="N",
+                        help="Parse pages in N worker processes (default: 0 = parse on threads)")
+    parser.add_argument("--rate",       type=float, default=0.3, help="Min delay between requests to the same host (default: 0.3s)")
     parser.add_argument("--timeout",    type=int, default=10,  help="Request timeout seconds (default: 10)")
     parser.add_argument("--max-pages",  type=int, default=200, help="Max pages to crawl (default: 200)")
     parser.add_argument("--subdomains", action="store_true",   help="Also crawl subdomains")
+    parser.add_argument("--cache",      nargs="?", const=HTTP_CACHE_FILE, metavar="FILE",
+                        help=f"Keep pages in an HTTP cache and revalidate them on later runs (default file: {HTTP_CACHE_FILE})")
+    parser.add_argument("--since-last", nargs="?", const=PAGE_INDEX_FILE, metavar="FILE",
+                        help=f"Reuse unchanged pages from the last run and report only new, changed and removed matches (default file: {PAGE_INDEX_FILE})")
+    parser.add_argument("--dedup",      nargs="?", type=int, const=3, metavar="K",
+                        help="Skip pages whose text SimHash is within K bits of an earlier page's (default K: 3)")
+    parser.add_argument("--visited",    choices=VISITED_KINDS, default="set",
+                        help="Visited-URL store: exact set, 64-bit hashes (~9x smaller) or a Bloom filter (~30x smaller) (default: set)")
+    parser.add_argument("--visited-fp", type=float, default=0.001, metavar="RATE",
+                        help="False-positive rate for --visited bloom (default: 0.001)")
+    parser.add_argument("--strategy",   choices=STRATEGIES, default="bfs",
+                        help="Crawl order: breadth-first, or the most promising links first (default: bfs)")
+    parser.add_argument("--frontier",   choices=FRONTIER_KINDS, default="memory",
+                        help="Keep the crawl frontier in memory or in a temporary SQLite file (default: memory)")
+    parser.add_argument("--jobdir",     metavar="DIR",
+                        help="Checkpoint the crawl to DIR so it can be resumed with --resume")
+    parser.add_argument("--resume",     metavar="JOBDIR",
+                        help="Continue the crawl checkpointed in JOBDIR")
     parser.add_argument("--verbose",    action="store_true",   help="Show debug logs")
+    parser.add_argument("--output", "-o", action="append", metavar="FILE",
+                        help="Stream matches to FILE as they are found: .csv, .jsonl, .jsonl.gz, "
+                             ".parquet or .arrow "
+                             "(repeatable; default: results_<keyword>_<time>.csv)")
+    parser.add_argument("--db",         metavar="FILE",
+                        help="Also add matches to an indexed SQLite store (pages, people, emails, "
+                             "phones, departments, keyword hits) shared across crawls")
     parser.add_argument("--no-json",    action="store_true",   help="Skip JSON output")
     parser.add_argument("--no-emails",  action="store_true",   help="Skip email list output")
     return parser.parse_args()
 
+def run_crawl(args, options: dict):
+    """Run a crawl built from `options` and save what it found."""
+    jobdir = args.resume or args.jobdir
+    if jobdir:
+        options["jobdir"] = jobdir
+        if not args.resume:
+            JobCheckpoint(jobdir).save_options(options)
+    outputs = list(args.output or [])
+    if not outputs and not options.get("index_path"):
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_kw = re.sub(r"\W+", "_", options["keyword"])[:20]
+        outputs = [f"results_{safe_kw}_{ts}.csv"]
+    try:
+        sinks = [make_sink(path, options["keyword"]) for path in outputs]
+        if args.db:
+            sinks.append(SqliteSink(args.db, options["keyword"]))
+    except (ValueError, RuntimeError) as e:
+        print(f"{C.RED}❌ {e}{C.RESET}")
+        sys.exit(1)
+    console = ConsoleReporter(split_keywords(options["keyword"]))
+    crawler = make_engine(args.engine, args.concurrency, sinks=sinks,
+                          on_result=console.on_result, on_log=console.on_log, **options)
+    if args.resume:
+        crawler.restore_checkpoint()
+
+    interrupted = False
+    console.start(crawler)
+    try:
+        crawler.run()
+    except KeyboardInterrupt:
+        interrupted = True
+        print(f"\n{C.YELLOW}⚠ Crawl interrupted by user.{C.RESET}")
+        if jobdir:
+            print(f"{C.GREY}Continue it with --resume {jobdir}{C.RESET}")
+    finally:
+        for sink in sinks:
+            sink.close()
+    console.summary(crawler)
+
+    results = crawler.results
+    if sinks and results:
+        print(f"\n{C.BOLD}💾 Results streamed to:{C.RESET}")
+        for sink in sinks:
+            print(f"{C.GREEN}✅ {sink.path} ({sink.written} rows){C.RESET}")
+    if crawler.index and not interrupted:
+        # An interrupted crawl keeps its rows staged until it is resumed and finished
+        save_changes_report(crawler, console)
+        return
+    if not results:
+        print(f"{C.YELLOW}⚠ No pages matched any of the keywords: {', '.join(crawler.keywords)}{C.RESET}")
+        sys.exit(0)
+
+    print(f"\n{C.CYAN}{C.BOLD}🎯 Search Complete! Found {len(results)} matching pages.{C.RESET}\n")
+
+def save_changes_report(crawler: CrawlEngine, console: ConsoleReporter):
+    changes = crawler.index.changes(crawler.results)
+    counts = defaultdict(int)
+    for status, _ in changes:
+        counts[status] += 1
+    path = None
+    if changes:
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_kw = re.sub(r"\W+", "_", crawler.keyword)[:20]
+        path = f"changes_{safe_kw}_{ts}.csv"
+        save_changes_csv(changes, path)
+    console.changes(counts, path)
+    crawler.index.commit()
+
+def resume_options(jobdir: str) -> dict:
+    options = JobCheckpoint(jobdir).load_options()
+    if options is None:
+        print(f"{C.RED}❌ No crawl job found in {jobdir}.{C.RESET}")
+        sys.exit(1)
+    print(f"{C.CYAN}↻ Resuming crawl from {jobdir} — keyword(s): {options['keyword']}{C.RESET}")
+    return options
+
 # ─── Entry Point ─────────────────────────────────────────────────────────────
 def main():
     banner()
     args = parse_args()
+    if args.resume:
+        run_crawl(args, resume_options(args.resume))
+        return
 
     # Interactive input if not via CLI args
     start_url = args.url
     keyword   = args.keyword
-
+    seeds     = None
+
+    if args.seeds:
+        seeds = load_seeds(args.seeds, args.depth, args.max_pages, args.subdomains)
+        if not seeds:
+            print(f"{C.RED}❌ No URLs found in {args.seeds}.{C.RESET}")
+            sys.exit(1)
+        start_url = seeds[0].url
     if not start_url:
         start_url = input(f"{C.BOLD}Enter Website URL : {C.RESET}").strip()
     if not keyword:
@@ -481,9 +276,10 @@ def main():
 
     print(f"\n{C.GREY}Config → depth={args.depth} | workers={args.workers} | "
           f"rate={args.rate}s | max_pages={args.max_pages} | "
-          f"subdomains={'yes' if args.subdomains else 'no'}{C.RESET}")
+          f"subdomains={'yes' if args.subdomains else 'no'}"
+          f"{f' | sites={len(seeds)}' if seeds else ''}{C.RESET}")
 
-    crawler = Crawler(
+    options = dict(
         start_url=start_url,
         keyword=keyword,
         max_depth=args.depth,
@@ -493,28 +289,17 @@ def main():
         verbose=args.verbose,
         timeout=args.timeout,
         max_pages=args.max_pages,
+        seeds=seeds,
+        parse_procs=args.parse_procs,
+        cache_path=args.cache,
+        index_path=args.since_last,
+        dedup_distance=args.dedup,
+        visited=args.visited,
+        visited_fp_rate=args.visited_fp,
+        frontier=args.frontier,
+        strategy=args.strategy,
     )
-
-    try:
-        crawler.run()
-    except KeyboardInterrupt:
-        print(f"\n{C.YELLOW}⚠ Crawl interrupted by user.{C.RESET}")
-        crawler._print_summary()
-
-    results = crawler.results
-    if not results:
-        print(f"{C.YELLOW}⚠ No pages matched any of the keywords: {', '.join(crawler.keywords)}{C.RESET}")
-        sys.exit(0)
-
-    # Save outputs
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_kw = re.sub(r"\W+", "_", keyword)[:20]
-    base = f"results_{safe_kw}_{ts}"
-
-    print(f"\n{C.BOLD}💾 Saving results...{C.RESET}")
-    save_csv(results, base + ".csv")
-
-    print(f"\n{C.CYAN}{C.BOLD}🎯 Search Complete! Found {len(results)} matching pages.{C.RESET}\n")
+    run_crawl(args, options)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
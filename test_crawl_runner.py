@@ -0,0 +1,114 @@
+"""
+CrawlRunner, the GUI's way of running a crawl: on a thread or in a spawned
+process, stopped through its CancelToken and, failing that, terminated. Crawls
+go to a local server whose pages link on forever; /slow/ pages hang.
+
+    python -m pytest -q test_crawl_runner.py
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import engine
+from engine import CrawlRunner
+
+
+class _Site(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/slow/"):
+            time.sleep(30)
+        n = int(self.path.rstrip("/").rpartition("/")[2] or 0)
+        prefix = "/slow/" if self.path.startswith("/slow/") else "/"
+        links = "".join(f'<a href="{prefix}{k}">p{k}</a>' for k in range(2 * n + 1, 2 * n + 3))
+        body = f"<html><body><p>machine learning page {n}</p>{links}</body></html>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Site)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _options(url, **extra):
+    return dict(dict(start_url=url, keyword="machine learning", max_depth=20, max_pages=500,
+                     max_workers=2, rate_limit=0.0, timeout=60), **extra)
+
+
+def _drain_until_done(crawl, seconds):
+    results, deadline = [], time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        _, batch, _, done = crawl.drain()
+        results += batch
+        if done is not None:
+            return done, results
+        time.sleep(0.05)
+    raise AssertionError("crawl did not finish")
+
+
+def test_thread_crawl_reports_results_and_done(site):
+    crawl = CrawlRunner(_options(site + "/", max_pages=10))
+    crawl.start()
+    done, results = _drain_until_done(crawl, 30)
+    assert done == (10, 10) and len(results) == 10
+    assert crawl.finished and not crawl.kill()
+
+
+def test_stop_ends_a_process_crawl(site):
+    crawl = CrawlRunner(_options(site + "/", rate_limit=0.05), process=True)
+    crawl.start()
+    while not crawl.drain()[1]:
+        time.sleep(0.05)
+    crawl.stop()
+    crawled, _ = _drain_until_done(crawl, 30)[0]
+    assert 0 < crawled < 500
+    crawl.worker.join(10)
+    assert not crawl.worker.is_alive() and not crawl.kill()
+
+
+def test_kill_terminates_a_process_that_ignores_stop(site):
+    crawl = CrawlRunner(_options(site + "/slow/"), process=True)
+    crawl.start()
+    time.sleep(3)          # long enough to be inside the first (hanging) fetch
+    crawl.stop()
+    assert crawl.kill()
+    assert not crawl.worker.is_alive()
+    assert _drain_until_done(crawl, 5)[0] == (0, 0)
+
+
+def test_process_crawl_does_not_rerun_the_main_script(tmp_path, site):
+    # A GUI's main script imports Tk; the crawl process must not run it again
+    marker = tmp_path / "runs.txt"
+    script = tmp_path / "front_end.py"
+    script.write_text(textwrap.dedent(f"""
+        import sys, time
+        sys.path.insert(0, {os.path.dirname(os.path.abspath(engine.__file__))!r})
+        with open({str(marker)!r}, "a") as f:
+            f.write(__name__ + "\\n")
+        from engine import CrawlRunner
+        if __name__ == "__main__":
+            crawl = CrawlRunner(dict(start_url={site + '/'!r}, keyword="machine learning",
+                                     max_pages=3, rate_limit=0.0), process=True)
+            crawl.start()
+            while crawl.drain()[3] is None:
+                time.sleep(0.05)
+    """))
+    subprocess.run([sys.executable, str(script)], check=True, timeout=60)
+    assert marker.read_text().split() == ["__main__"]
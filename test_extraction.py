@@ -0,0 +1,112 @@
+"""
+The single-pass extractors in engine.py must return exactly what the simple
+per-entity / per-keyword / urljoin versions return. Each check runs over a
+handful of hand-picked pages plus a seeded random corpus built from the same
+fragments.
+
+    python -m pytest -q test_extraction.py
+"""
+
+import random
+from urllib.parse import urljoin, urlsplit
+
+import pytest
+
+from engine import (
+    KeywordMatcher, keyword_pattern, count_keyword, normalize_url, _resolve,
+    extract_entities, extract_names, extract_emails, extract_phones, extract_departments,
+)
+
+FUZZ_CASES = 3000
+
+ENTITY_FRAGMENTS = [
+    "Dr. A.K. Singh", "Prof. Rama Murthy", "Dr. S. K. Sharma", "Prof. Mary-Jane O'Brien",
+    "Assoc. Prof. Neha Gupta", "Asst Professor R. Iyer", "Emeritus Prof. J Rao", "Dr.",
+    "Prof", "Professor", "Dr X", "Drive", "Profile", "Assoc", "Asst.",
+    "singh@iitb.ac.in", "a.b+c@cse.iitd.ac.in", "x@y", "@", "foo@@bar.com", "m@ee.iitm.ac",
+    "+91 22 2576 7001", "(022) 2576-7001", "91-11-2659-1234", "12345", "2019 - 2021",
+    "1.2.3.4.5.6.7.8", "+1 (555) 010-9999 ext",
+    "Department of Computer Science", "Dept. of Electrical Engineering,",
+    "School of Management.", "Faculty of Arts\n", "Division of Physics<", "department of",
+    "DEPARTMENT OF MATHS.", "ſchool of Law.", "Dİvision of Bio,", "dıvision of Chem.",
+    "Depot", "Schooling", "Facts", "Divide",
+    " ", "  ", "\n", ", ", ". ", "<", "-", "(", ")", "é", "İ", "ſ", "ı", "1", "A", "a",
+]
+
+KEYWORDS = [
+    "machine learning", "machine", "IoT", "5G", "C++", "R&D", "café", "learning",
+    "deep learning", "ML", "Cafe", "ı", "İstanbul", "straße", "a", "B.Tech",
+]
+TEXT_FRAGMENTS = [
+    "Machine Learning", "machine-learning", "MACHINE learning", "BIoTechnology", "IoT",
+    "5G", "45G", "5Gs", "C++", "C+++", "R&D", "R&amp;D", "café", "CAFÉ", "cafe",
+    "learning", "Deep  learning", "deep learning", "ML", "HTML", "İstanbul", "istanbul",
+    "STRASSE", "straße", "B.Tech", "b.tech", "a", "A", "ı", "I", "İoT", "ıOT", "ſtraße",
+    "\u212aafe", "İ", "ſ",
+    " ", "\n", ", ", ".", "-", "_", "é", "1",
+]
+
+BASES = [
+    "https://www.iitb.ac.in/cse/people/faculty.html",
+    "https://www.iitb.ac.in/cse/people/",
+    "https://www.iitb.ac.in",
+    "http://Example.EDU:80/a/b/c?x=1&b=2",
+    "https://example.edu/a//b/./c/../d;jsessionid=ABC?utm_source=x&q=1",
+]
+HREF_FRAGMENTS = [
+    "", "/", "//", ".", "..", "./", "../", "a", "b.html", "?", "?q=1", "&x=2", "#top",
+    "#", ";jsessionid=1", "utm_medium=y", "https:", "http:", "HTTPS://Other.edu",
+    "//cdn.example.edu", ":443", ":80", "mailto:x@y", "javascript:void(0)", "%2F", " ",
+    "~user", "index.php", "fbclid=3", "a=1",
+]
+
+
+def _corpus(fragments, seed, n=FUZZ_CASES, max_parts=14):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(fragments) for _ in range(rng.randint(0, max_parts)))
+            for _ in range(n)]
+
+
+ENTITY_TEXTS = [
+    "Dr. A. K. Singh works on IoT. Contact: singh@iitx.ac.in, +91 22 2576 1001. "
+    "Department of Computer Science, IIT.",
+    "Prof. Rama Murthy, Dept. of Electrical Engineering, wireless 5G",
+    "Emails: a@b.co, a@b.co, c.d@e.org; phones 022-2576-7001 / 022-2576-7001",
+] + _corpus(ENTITY_FRAGMENTS, seed=6)
+
+
+@pytest.mark.parametrize("text", ENTITY_TEXTS)
+def test_extract_entities_matches_individual_extractors(text):
+    assert extract_entities(text) == (
+        extract_names(text), extract_emails(text), extract_phones(text), extract_departments(text))
+
+
+@pytest.mark.parametrize("text", _corpus(TEXT_FRAGMENTS, seed=5))
+def test_keyword_matcher_matches_per_keyword_regex(text):
+    hits = KeywordMatcher(KEYWORDS).scan(text)
+    for keyword, spans in zip(KEYWORDS, hits):
+        assert len(spans) == count_keyword(text, keyword)
+        assert spans == [m.span() for m in keyword_pattern(keyword).finditer(text)]
+
+
+# Every keyword with an ASCII word, so each one gets a pre-filter probe ("ı" has none)
+PROBED_MATCHERS = [KeywordMatcher([kw]) for kw in KEYWORDS if kw != "ı"]
+
+
+@pytest.mark.parametrize("text", _corpus(TEXT_FRAGMENTS, seed=55, n=1000))
+def test_keyword_prefilter_never_drops_a_match(text):
+    for matcher in PROBED_MATCHERS:
+        assert matcher._probes is not None
+        if matcher.scan(text)[0]:
+            assert matcher.could_match(text), matcher.keywords
+
+
+@pytest.mark.parametrize("base", BASES)
+def test_resolve_matches_urljoin_then_normalize(base):
+    split = urlsplit(base)
+    for href in _corpus(HREF_FRAGMENTS, seed=base, n=FUZZ_CASES // len(BASES), max_parts=5):
+        try:
+            expected = normalize_url(urljoin(base, href))
+        except ValueError:      # e.g. an invalid port; extract_links skips those links
+            continue
+        assert _resolve(split, href).geturl() == expected, href
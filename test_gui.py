@@ -0,0 +1,210 @@
+"""
+The GUI's row and event bookkeeping, run without a display: VirtualTable and
+App._drain_events are driven through stand-ins for the Treeview, scrollbar and
+crawl. The Treeview queues <<TreeviewSelect>> and, taking the stricter of Tk's
+behaviours, only sends it when the selection actually changes.
+
+    python -m pytest -q test_gui.py
+"""
+
+import pytest
+
+gui = pytest.importorskip("gui")
+
+
+class FakeTree:
+    def __init__(self):
+        self.values, self.sel, self.focused, self.queued = {}, (), None, []
+
+    def insert(self, parent, index, iid):
+        self.values[iid] = None
+
+    def delete(self, iid):
+        del self.values[iid]
+        self.sel = tuple(i for i in self.sel if i != iid)
+
+    def item(self, iid, values, tags):
+        self.values[iid] = values
+
+    def selection(self):
+        return self.sel
+
+    def selection_set(self, items):
+        items = (items,) if isinstance(items, str) else tuple(items)
+        if items != self.sel:
+            self.sel = items
+            self.queued.append("<<TreeviewSelect>>")
+
+    def focus(self, iid):
+        self.focused = iid
+
+    def bbox(self, iid):
+        return (0, 40, 600, 32)
+
+
+class FakeScrollbar:
+    def set(self, first, last):
+        self.view = (first, last)
+
+
+def make_table(rows, visible=5):
+    table = gui.VirtualTable.__new__(gui.VirtualTable)
+    table._rows, table._values, table.picked = rows, lambda r: (r,), []
+    table._select = table.picked.append
+    table._top = table._slots = 0
+    table._follow, table._chosen, table._heading = True, None, 40
+    table.tree, table._vsb = FakeTree(), FakeScrollbar()
+    table._visible = lambda: visible
+    return table
+
+
+def settle(table):
+    """Let the event loop deliver the queued <<TreeviewSelect>> events."""
+    while table.tree.queued:
+        table.tree.queued.pop(0)
+        table._on_select()
+
+
+def shown(table):
+    return [table.tree.values[str(slot)][0] for slot in range(table._slots)]
+
+
+def highlighted(table):
+    return [table.tree.values[iid][0] for iid in table.tree.sel]
+
+
+def click(table, slot):
+    table.tree.selection_set(str(slot))
+    settle(table)
+
+
+def key(table, delta):
+    """An arrow key: the widget binding first, then Treeview's own unless broken."""
+    if table._step(delta) != "break" and table.tree.sel:
+        slot = min(max(int(table.tree.sel[0]) + delta, 0), table._slots - 1)
+        table.tree.selection_set(str(slot))
+    settle(table)
+
+
+def test_follows_new_rows_while_at_the_bottom():
+    rows = []
+    table = make_table(rows)
+    table.refresh()
+    assert shown(table) == [] and table._vsb.view == (0.0, 1.0)
+    rows.extend(range(3))
+    table.refresh()
+    assert shown(table) == [0, 1, 2]
+    rows.extend(range(3, 12))
+    table.refresh()
+    assert shown(table) == [7, 8, 9, 10, 11] and table._vsb.view == (7 / 12, 1.0)
+
+
+def test_selection_stays_with_its_row_as_rows_stream_in():
+    rows = list(range(10))
+    table = make_table(rows)
+    table.refresh()
+    click(table, 3)
+    assert table.picked == [8] and highlighted(table) == [8]
+    rows.extend(range(10, 12))
+    table.refresh()
+    settle(table)
+    assert highlighted(table) == [8] and table.picked == [8]
+    rows.extend(range(12, 20))
+    table.refresh()
+    settle(table)
+    assert highlighted(table) == [] and table.picked == [8]     # scrolled out of view
+
+
+def test_wheel_scroll_moves_the_highlight_with_the_row():
+    rows = list(range(50))
+    table = make_table(rows)
+    table.refresh()
+    click(table, 0)
+    assert table.picked == [45]
+    table._scroll_by(-3)
+    settle(table)
+    assert shown(table) == [42, 43, 44, 45, 46] and highlighted(table) == [45]
+    table._scroll_by(-3)
+    settle(table)
+    assert shown(table)[0] == 39 and highlighted(table) == []
+    table._on_scroll("moveto", "0.9")
+    settle(table)
+    assert shown(table)[0] == 45 and highlighted(table) == [45] and table.picked == [45]
+    assert table._follow
+
+
+def test_arrow_keys_scroll_past_the_edge_slots():
+    rows = list(range(20))
+    table = make_table(rows)
+    table.refresh()
+    table._scroll_to(0)
+    click(table, 3)
+    for _ in range(6):
+        key(table, 1)
+    assert table.picked == [3, 4, 5, 6, 7, 8, 9]
+    assert shown(table) == [5, 6, 7, 8, 9] and highlighted(table) == [9]
+    for _ in range(8):
+        key(table, -1)
+    assert table.picked[-8:] == [8, 7, 6, 5, 4, 3, 2, 1]
+    assert shown(table)[0] == 1 and highlighted(table) == [1]
+    key(table, -1)
+    key(table, -1)
+    assert table.picked[-1] == 0 and shown(table)[0] == 0
+    table._scroll_to(20)
+    click(table, 4)
+    key(table, 1)
+    assert table.picked[-1] == 19 and highlighted(table) == [19]
+
+
+def test_clearing_rows_drops_the_selection():
+    rows = list(range(8))
+    table = make_table(rows)
+    table.refresh()
+    click(table, 1)
+    rows.clear()
+    table.refresh()
+    settle(table)
+    assert shown(table) == [] and table.tree.sel == () and table._chosen is None
+    rows.extend(range(8))
+    table.refresh()
+    settle(table)
+    assert highlighted(table) == []
+
+
+class FakeCrawl:
+    def __init__(self, *drains):
+        self.drains, self.left = list(drains), 0
+
+    def drain(self, limit):
+        return self.drains.pop(0) if self.drains else ([], [], None, None)
+
+    def pending(self):
+        return self.left > 0
+
+
+class FakeApp:
+    def __init__(self, crawl):
+        self._crawl, self._running, self.calls, self._drain_job = crawl, True, [], None
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name,) + args)
+
+    def after(self, ms, fn):
+        self.calls.append(("after", ms))
+        return "job"
+
+
+def test_drain_events_applies_a_tick_in_one_go_and_stops_when_done():
+    app = FakeApp(FakeCrawl(
+        ([("a", "crawl"), ("b", "match")], ["r1", "r2"], (5, 2, 50), None),
+        ([], [], (9, 2, 50), (9, 2))))
+    gui.App._drain_events(app)
+    assert app.calls == [("_log_append_many", [("a", "crawl"), ("b", "match")]),
+                         ("_add_results", ["r1", "r2"]), ("_update_prog", 5, 2, 50),
+                         ("after", gui.UI_TICK_MS)]
+    app.calls.clear()
+    app._on_done = lambda *done: (app.calls.append(("_on_done",) + done),
+                                  setattr(app, "_running", False))
+    gui.App._drain_events(app)
+    assert app.calls == [("_update_prog", 9, 2, 50), ("_on_done", 9, 2)]
+    assert app._drain_job is None